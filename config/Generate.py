@@ -1,7 +1,15 @@
 # maze_generator.py
 
 import random
+import time
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
 from config.game_config import GameConfig
+from config.maze_grid import MazeGrid, DisjointSet
+from config.maze_cache import MazeCache
+from config.cell_placement import CellPlacement
+from config.open_cells import OpenCellIndex
 
 class MazeGenerator:
     WALL = 0
@@ -10,18 +18,93 @@ class MazeGenerator:
     START = 3
     GOAL = 4
 
+    # Algoritmos de generación: nombre -> método que talla el laberinto perfecto
+    ALGORITHMS = {
+        "dfs": "_carve_dfs",
+        "kruskal": "_carve_kruskal",
+        "prim": "_carve_prim",
+        "wilson": "_carve_wilson",
+        "eller": "_carve_eller"
+    }
+
+    # Atajos de add_imperfections: uno cada SHORTCUT_ROWS filas, salvo que GameConfig fije una densidad
+    SHORTCUT_ROWS = 3
+
+    # Tablas para pasar una fila de celdas a texto binario: abierta (camino o atajo) o muro
+    _OPEN_BITS = bytes.maketrans(bytes(range(256)), b"0" + b"1" * 2 + b"0" * 253)
+    _WALL_BITS = bytes.maketrans(bytes(range(256)), b"1" + b"0" * 255)
+
+    # Laberintos ya generados, por (algoritmo, filas, columnas, semilla, ajustes de atajos y de la meta)
+    cache = MazeCache()
+
+    @staticmethod
+    def make_rng(seed=None, rng=None):
+        """
+        This method returns the (seed, rng) pair used by a generation. If no rng is given, a new random.Random is
+        created from the seed, and if there is no seed either, a new seed is drawn first, so every generation
+        has a seed that can be recorded. If an rng is given it is used as it is, and the seed stays as given.
+        """
+
+        if rng is None:
+            if seed is None:
+                seed = random.randrange(2 ** 32)
+            rng = random.Random(seed)
+        return seed, rng
+
     @classmethod
-    def generate_maze(cls):
+    def generation_settings(cls):
+        """
+        This method returns the settings of add_imperfections and place_goal that change the generated maze,
+        as a tuple (shortcut density, SHORTCUT_ROWS, goal placement) that is part of the cache key.
+        They are read from GameConfig, so a caller that generates in another thread should read them first
+        and pass them to generate_maze, so the maze matches the settings it is stored under.
+        """
+
+        return (GameConfig.get_shortcut_density(), cls.SHORTCUT_ROWS, GameConfig.get_goal_placement())
+
+    @classmethod
+    def shortcut_count(cls, rows, cols, settings=None):
+        """
+        This method returns how many shortcuts add_imperfections places in a maze of the given size.
+        By default it is one every SHORTCUT_ROWS rows (at least one); if GameConfig has a shortcut density,
+        it is that density times the number of cells. Each shortcut joins two parts of the perfect maze,
+        so it adds exactly one independent cycle: the count is also the number of cycles of the maze.
+        The settings parameter is a tuple from generation_settings; by default the current one is used.
         """
-        This method generates a maze with the specified size.
 
-        The size is determined by GameConfig.get_maze_size().
-        The maze is a 2D list of WALL, PATH, SHORTCUT, START, or GOAL values.
+        density, shortcut_rows, _ = settings if settings is not None else cls.generation_settings()
+        if density is None:
+            return max(1, rows // shortcut_rows)
+        return round(density * rows * cols)
+
+    @classmethod
+    def generate_maze(cls, size=None, algorithm=None, seed=None, rng=None, settings=None):
+        """
+        This method generates a maze with the specified size.
 
-        return: A 2D list representing the maze
+        The size is determined by GameConfig.get_maze_size() unless a size is given, and the
+        algorithm that carves the perfect maze by GameConfig.get_generation_algorithm() unless an
+        algorithm is given (see ALGORITHMS). Every algorithm carves the same lattice of cells at odd
+        coordinates, and then the maze goes through the same post-processing: the border walls,
+        _fix_bottom_left_corner, add_imperfections and the goal placement.
+
+        Every random choice comes from one random.Random (see make_rng), so the same seed, algorithm, size and
+        imperfection settings always give the same maze; its algorithm and seed are recorded in the MazeGrid.
+        The settings are the ones of generation_settings, read when the generation starts unless they are given.
+        Mazes made from a seed are kept in the LRU cache, so asking for the same board again returns a copy
+        of it at once. When an rng is given without a seed, the maze cannot be reproduced and is not cached.
+        The maze is a MazeGrid (a compact grid of one byte per cell) of WALL, PATH,
+        SHORTCUT, START, or GOAL values. It can be read like a 2D list with maze[row][col].
+
+        return: A MazeGrid representing the maze
         """
 
-        size = GameConfig.get_maze_size()
+        if size is None:
+            size = GameConfig.get_maze_size()
+        if algorithm is None:
+            algorithm = GameConfig.get_generation_algorithm()
+        if algorithm not in cls.ALGORITHMS:
+            raise ValueError(f"Algoritmo de generacion no valido: {algorithm}")
         rows = size
         cols = size
 
@@ -30,48 +113,401 @@ class MazeGenerator:
         if cols % 2 == 0:
             cols += 1
 
-        maze = [[cls.WALL for _ in range(cols)] for _ in range(rows)]
+        if settings is None:
+            settings = cls.generation_settings()
+        seed, rng = cls.make_rng(seed, rng)
+        key = (algorithm, rows, cols, seed, settings)
+        if seed is not None:
+            cached = cls.cache.get(key)
+            if cached is not None:
+                return cached
+
+        maze = MazeGrid(rows, cols, fill=cls.WALL)
+        maze.algorithm = algorithm
+        maze.seed = seed
 
-        # Start carving passages from (1,1)
-        maze[1][1] = cls.PATH
-        cls._carve_passages(maze, 1, 1, rows, cols)
+        getattr(cls, cls.ALGORITHMS[algorithm])(maze, rows, cols, rng)
 
       
         for i in range(rows):
-            maze[i][0] = maze[i][cols-1] = cls.WALL
+            maze.set(i, 0, cls.WALL)
+            maze.set(i, cols-1, cls.WALL)
         for j in range(cols):
-            maze[0][j] = maze[rows-1][j] = cls.WALL
+            maze.set(0, j, cls.WALL)
+            maze.set(rows-1, j, cls.WALL)
 
 
         cls._fix_bottom_left_corner(maze, rows, cols)
 
-        cls.add_imperfections(maze, rows, cols)
+        cls.add_imperfections(maze, rows, cols, rng, settings)
 
-        cls.place_random_goal(maze)
-        
+        # Las paredes ya no cambian: el índice de celdas abiertas viaja con el laberinto (y sus copias)
+        cls.open_cell_index(maze)
+        cls.place_goal(maze, rng, settings[2])
+
+        if seed is not None:
+            cls.cache.put(key, maze)
         return maze
 
     @classmethod
-    def _carve_passages(cls, maze, x, y, rows, cols):
+    def _carve_dfs(cls, maze, rows, cols, rng):
+        """
+        This method carves a perfect maze with the recursive backtracker (randomized depth-first search),
+        starting from (1, 1). It makes long corridors with few branches.
+        """
+
+        maze.set(1, 1, cls.PATH)
+        cls._carve_passages(maze, 1, 1, rows, cols, rng)
+
+    @classmethod
+    def _open_lattice(cls, maze, rows, cols):
+        """
+        This method turns every cell at odd coordinates into a path, leaving all the walls between them.
+        The lattice algorithms (Kruskal, Prim, Wilson and Eller) then only open walls.
+
+        Returns:
+            tuple: The (height, width) of the lattice, in cells.
+        """
+
+        height, width = (rows - 1) // 2, (cols - 1) // 2
+        row_cells = bytes([cls.PATH]) * width
+        for r in range(1, rows - 1, 2):
+            maze.cells[r * cols + 1:r * cols + 2 * width:2] = row_cells
+        return height, width
+
+    @classmethod
+    def _open_wall(cls, maze, width, a, b):
+        """
+        This method opens the wall between the lattice cells a and b (numbered row by row), which must be neighbours.
+        """
+
+        ai, aj = divmod(a, width)
+        bi, bj = divmod(b, width)
+        maze.cells[(ai + bi + 1) * maze.cols + aj + bj + 1] = cls.PATH
+
+    @staticmethod
+    def _lattice_neighbors(k, height, width):
+        """
+        Returns the lattice cells next to the cell k.
+        """
+
+        i, j = divmod(k, width)
+        neighbors = []
+        if i > 0:
+            neighbors.append(k - width)
+        if j > 0:
+            neighbors.append(k - 1)
+        if i < height - 1:
+            neighbors.append(k + width)
+        if j < width - 1:
+            neighbors.append(k + 1)
+        return neighbors
+
+    @classmethod
+    def _carve_kruskal(cls, maze, rows, cols, rng):
+        """
+        This method carves a perfect maze with randomized Kruskal's algorithm.
+
+        Every wall between two lattice cells is listed (as cell * 2 for the wall on its right and
+        cell * 2 + 1 for the wall below, in a compact array) and shuffled. Then the walls are opened in
+        that order whenever they separate two cells that are not connected yet, which is checked with
+        a union-find structure. The result has many short dead ends.
+        """
+
+        height, width = cls._open_lattice(maze, rows, cols)
+        walls = array('i')
+        for k in range(height * width):
+            i, j = divmod(k, width)
+            if j < width - 1:
+                walls.append(k * 2)
+            if i < height - 1:
+                walls.append(k * 2 + 1)
+        rng.shuffle(walls)
+
+        sets = DisjointSet(height * width)
+        for wall in walls:
+            a = wall >> 1
+            b = a + width if wall & 1 else a + 1
+            if sets.union(a, b):
+                cls._open_wall(maze, width, a, b)
+
+    @classmethod
+    def _carve_prim(cls, maze, rows, cols, rng):
+        """
+        This method carves a perfect maze with randomized Prim's algorithm.
+
+        The maze grows from a random cell. The frontier keeps the cells next to the maze; each step takes
+        a random frontier cell, joins it to a random neighbour that is already in the maze and adds its
+        new neighbours to the frontier. Removing from the frontier swaps the cell with the last one, so
+        each step takes constant time. The result branches a lot near the starting cell.
+        """
+
+        height, width = cls._open_lattice(maze, rows, cols)
+        in_maze = bytearray(height * width)
+        in_frontier = bytearray(height * width)
+        frontier = []
+
+        def add_frontier(k):
+            for neighbor in cls._lattice_neighbors(k, height, width):
+                if not in_maze[neighbor] and not in_frontier[neighbor]:
+                    in_frontier[neighbor] = 1
+                    frontier.append(neighbor)
+
+        first = rng.randrange(height * width)
+        in_maze[first] = 1
+        add_frontier(first)
+        while frontier:
+            i = rng.randrange(len(frontier))
+            k = frontier[i]
+            frontier[i] = frontier[-1]
+            frontier.pop()
+
+            joined = [n for n in cls._lattice_neighbors(k, height, width) if in_maze[n]]
+            cls._open_wall(maze, width, k, rng.choice(joined))
+            in_maze[k] = 1
+            add_frontier(k)
+
+    @classmethod
+    def _carve_wilson(cls, maze, rows, cols, rng):
+        """
+        This method carves a perfect maze with Wilson's algorithm, which picks every possible perfect maze
+        with the same probability (a uniform spanning tree).
+
+        The tree starts with one random cell. From each cell that is not in the tree yet, a random walk goes
+        on until it reaches the tree; the walk only remembers the last direction taken from each cell, which
+        erases its loops, and then that loop-free path is added to the tree. The first walks are long, so it
+        is the slowest algorithm on large mazes.
+        """
+
+        height, width = cls._open_lattice(maze, rows, cols)
+        size = height * width
+        in_tree = bytearray(size)
+        in_tree[rng.randrange(size)] = 1
+        next_cell = array('i', [0]) * size  # Última salida del paseo desde cada celda
+
+        order = array('i', range(size))
+        rng.shuffle(order)
+        for walk_start in order:
+            # Paseo aleatorio hasta llegar al árbol
+            k = walk_start
+            while not in_tree[k]:
+                next_cell[k] = rng.choice(cls._lattice_neighbors(k, height, width))
+                k = next_cell[k]
+
+            # Añadir el camino sin ciclos al árbol
+            k = walk_start
+            while not in_tree[k]:
+                in_tree[k] = 1
+                cls._open_wall(maze, width, k, next_cell[k])
+                k = next_cell[k]
+
+    @classmethod
+    def _eller_rows(cls, height, width, rng):
+        """
+        This method runs Eller's algorithm, which builds a perfect maze one row of the lattice at a time keeping
+        only the current row in memory.
+
+        Each cell of the row has the label of the set of cells it is connected to. Neighbour cells of different
+        sets are joined at random (in the last row, all of them), and every set opens at least one wall down so
+        no set is left closed. Sets are merged moving the smaller one into the bigger one.
+
+        It is a generator that yields, for each row, a tuple (right, down) of bytearrays of length width:
+        right[j] is 1 if the wall between cells j and j + 1 is open, and down[j] if the wall below cell j is open.
+        """
+
+        labels = list(range(width))
+        members = {j: [j] for j in range(width)}
+        next_label = width
+        for i in range(height):
+            last = i == height - 1
+            right = bytearray(width)
+            down = bytearray(width)
+
+            # Unir celdas vecinas de conjuntos distintos
+            for j in range(width - 1):
+                a, b = labels[j], labels[j + 1]
+                if a != b and (last or rng.random() < 0.5):
+                    right[j] = 1
+                    if len(members[a]) < len(members[b]):
+                        a, b = b, a
+                    for col in members[b]:
+                        labels[col] = a
+                    members[a].extend(members.pop(b))
+
+            if not last:
+                # Cada conjunto baja por al menos una celda
+                new_labels = [None] * width
+                for label, cols in members.items():
+                    going_down = [col for col in cols if rng.random() < 0.5] or [rng.choice(cols)]
+                    for col in going_down:
+                        down[col] = 1
+                        new_labels[col] = label
+                for j in range(width):
+                    if new_labels[j] is None:
+                        new_labels[j] = next_label
+                        next_label += 1
+                labels = new_labels
+                members = {}
+                for j, label in enumerate(labels):
+                    members.setdefault(label, []).append(j)
+
+            yield right, down
+
+    @classmethod
+    def _carve_eller(cls, maze, rows, cols, rng):
+        """
+        This method carves a perfect maze with Eller's algorithm (see _eller_rows), opening the walls of each row
+        as it is produced. It makes long horizontal corridors in the last row.
+        """
+
+        height, width = cls._open_lattice(maze, rows, cols)
+        cells = maze.cells
+        for i, (right, down) in enumerate(cls._eller_rows(height, width, rng)):
+            r = 2 * i + 1
+            for j in range(width):
+                if right[j]:
+                    cells[r * cols + 2 * j + 2] = cls.PATH
+                if down[j]:
+                    cells[(r + 1) * cols + 2 * j + 1] = cls.PATH
+
+    @classmethod
+    def iter_streamed_rows(cls, rows, cols, rng):
+        """
+        This method generates a maze with Eller's algorithm and yields it one grid row at a time, as a bytearray of
+        cols values, without ever holding the whole maze. Only Eller's labels for one row and a window of three grid
+        rows are kept, so the memory is proportional to the width and the height can be as big as wanted.
+
+        The post-processing is done on the window too: each row gets its shortcuts (with the same rules as
+        add_imperfections, about shortcut_count of them in total) once the row below it is known. The start is the
+        top left cell (1, 1) and the goal the bottom right cell (rows - 2, cols - 2), which always belong to the maze.
+        Even sizes are rounded up like in generate_maze. Every random choice comes from rng.
+        """
+
+        if rows % 2 == 0:
+            rows += 1
+        if cols % 2 == 0:
+            cols += 1
+        height, width = (rows - 1) // 2, (cols - 1) // 2
+        if height * width < 2:
+            raise ValueError("El laberinto necesita al menos dos celdas para el inicio y la meta")
+        shortcuts_per_row = cls.shortcut_count(rows, cols) / max(1, rows - 2)
+
+        def grid_rows():
+            yield bytearray(cols)  # Borde superior
+            for i, (right, down) in enumerate(cls._eller_rows(height, width, rng)):
+                # right y down ya valen WALL (0) o PATH (1): se copian como rebanadas
+                cell_row = bytearray(cols)
+                cell_row[1:2 * width:2] = bytes([cls.PATH]) * width
+                cell_row[2:2 * width + 1:2] = right
+                wall_row = bytearray(cols)
+                wall_row[1:2 * width:2] = down
+                if i == 0:
+                    cell_row[1] = cls.START
+                if i == height - 1:
+                    cell_row[cols - 2] = cls.GOAL
+                yield cell_row
+                yield wall_row  # La última es el borde inferior: Eller no baja desde la última fila
+
+        window = []
+        for row in grid_rows():
+            window.append(row)
+            if len(window) < 3:
+                continue
+            # Atajos de esta fila: la parte entera de shortcuts_per_row, más uno con la probabilidad del resto
+            wanted = int(shortcuts_per_row) + (rng.random() < shortcuts_per_row % 1)
+            if wanted:
+                candidates = cls._shortcut_candidates(*(cls._row_masks(row) for row in window))
+                cls._place_shortcuts(window, [candidates], wanted, rng, first_row=1)
+            yield window.pop(0)
+        yield from window
+
+    @classmethod
+    def stream_maze_to_file(cls, file_path, rows, cols, game_mode="Solver", seed=None):
+        """
+        This method generates a maze with iter_streamed_rows and writes each row to a save file as soon as it is made,
+        so mazes far bigger than the memory (for example 10,000 x 200,000 for stress tests) can be created.
+
+        The file has the same keys as the save files of MazeWidget.save_map_solution ("map", "game_mode",
+        "start_point", "goal_point", "rows", "cols", "seed" and "algorithm"), but the rows of the map are written in
+        compact JSON, one per line. Each row is turned into text with bytes operations instead of a Python loop per cell.
+        The same seed always writes the same file.
+
+        Returns:
+            tuple: The (rows, cols) of the maze written (even sizes are rounded up).
+        """
+
+        if rows % 2 == 0:
+            rows += 1
+        if cols % 2 == 0:
+            cols += 1
+        seed, rng = cls.make_rng(seed)
+        digits = bytes.maketrans(bytes(range(10)), b"0123456789")
+        line = bytearray(b"," * (2 * cols - 1))
+        with open(file_path, "wb") as file:
+            file.write(b'{\n    "map": [\n')
+            for r, row in enumerate(cls.iter_streamed_rows(rows, cols, rng)):
+                line[0::2] = row.translate(digits)
+                file.write(b"        [" + line + (b"],\n" if r < rows - 1 else b"]\n"))
+            file.write(f'    ],\n    "game_mode": "{game_mode}",\n    "start_point": [1, 1],\n'
+                       f'    "goal_point": [{rows - 2}, {cols - 2}],\n    "rows": {rows},\n    "cols": {cols},\n'
+                       f'    "seed": {seed},\n    "algorithm": "eller"\n}}\n'.encode())
+        return rows, cols
+
+    @classmethod
+    def benchmark(cls, sizes=(201, 501, 1001), algorithms=None, seed=0):
+        """
+        This method measures how long each generation algorithm takes to generate a maze of each size,
+        including the shared post-processing. Every maze uses the same seed, so the results can be repeated,
+        and the cache is skipped (the rng is passed directly) so every maze is really carved.
+
+        Returns:
+            list: Tuples (algorithm, size, seconds).
+        """
+
+        results = []
+        for algorithm in algorithms or cls.ALGORITHMS:
+            for size in sizes:
+                start = time.perf_counter()
+                cls.generate_maze(size, algorithm, rng=random.Random(seed))
+                results.append((algorithm, size, time.perf_counter() - start))
+        return results
+
+    @classmethod
+    def _carve_passages(cls, maze, x, y, rows, cols, rng):
         """
         This method modifies the maze to create paths between cells.
         Starting from the given (x, y) position, it attempts to carve paths
         to adjacent cells in random directions, creating a perfect maze.
+
+        The search uses an explicit stack instead of recursion: each entry is a
+        cell with the directions it still has to try. This way the depth of the
+        maze is not limited by Python's recursion limit, so large mazes can be
+        generated, and the work and memory grow linearly with the number of cells.
         """
         # left, right, up, down (two steps)
         directions = [(0, -2), (0, 2), (-2, 0), (2, 0)]
-        random.shuffle(directions)  # Random directions 
 
-        for dx, dy in directions:
-            # Calculate new position
-            nx, ny = x + dx, y + dy
-            # Check if new position is in bounds and is a wall
-            if 0 < nx < rows and 0 < ny < cols and maze[nx][ny] == cls.WALL:
-                maze[nx][ny] = cls.PATH
-             
-                maze[x + dx // 2][y + dy // 2] = cls.PATH
-                
-                cls._carve_passages(maze, nx, ny, rows, cols)
+        def shuffled_directions():
+            dirs = directions[:]
+            rng.shuffle(dirs)  # Random directions
+            return iter(dirs)
+
+        cells = maze.cells
+        stack = [(x, y, shuffled_directions())]
+        while stack:
+            cx, cy, pending = stack[-1]
+            for dx, dy in pending:
+                # Calculate new position
+                nx, ny = cx + dx, cy + dy
+                # Check if new position is in bounds and is a wall
+                if 0 < nx < rows and 0 < ny < cols and cells[nx * cols + ny] == cls.WALL:
+                    cells[nx * cols + ny] = cls.PATH
+                    cells[(cx + dx // 2) * cols + cy + dy // 2] = cls.PATH
+                    stack.append((nx, ny, shuffled_directions()))
+                    break
+            else:
+                # No quedan direcciones por probar: retroceder
+                stack.pop()
 
     @classmethod
     def _fix_bottom_left_corner(cls, maze, rows, cols):
@@ -102,33 +538,116 @@ class MazeGenerator:
                     break
 
     @classmethod
-    def add_imperfections(cls, maze, rows, cols):
+    def add_imperfections(cls, maze, rows, cols, rng=random, settings=None):
         """
     This method adds imperfections to the maze by introducing shortcuts.
 
     This method randomly places shortcuts in the maze to make it less
     more challenging or less perfect as well. Shortcuts are added by replacing walls
     with paths in valid positions that do not compromise the maze's solvability.
-    The number of shortcuts added is proportional to the maze size, ensuring
-    at least one shortcut is always added. The process is limited by a maximum
-    number of attempts to prevent infinite loops.
+    The number of shortcuts added is given by shortcut_count (by default one every SHORTCUT_ROWS rows,
+    at least one, or the density set in GameConfig), with the given generation settings.
+
+    Instead of trying random cells until one is valid, every valid position (see _is_valid_shortcut) is
+    found first with one scan of the grid, where each row is handled as a big integer bitmask, so the
+    conditions are checked for a whole row at once. Then the shortcuts are sampled from those candidates
+    without replacement, so the requested number is always placed when there are enough candidates and
+    the time is bounded at any size. The random positions come from rng.
 
         """
 
-        num_shortcuts = max(1, rows // 3)
-        added = 0
-        attempts = 0
-        max_attempts = 200  # Límite para evitar bucles infinitos
+        cells = maze.cells
+        masks = [cls._row_masks(cells[r * cols:(r + 1) * cols]) for r in range(rows)]
+        candidates = [cls._shortcut_candidates(masks[r - 1], masks[r], masks[r + 1]) for r in range(1, rows - 1)]
+        rows_view = [maze[r] for r in range(rows)]
+        cls._place_shortcuts(rows_view, candidates, cls.shortcut_count(rows, cols, settings), rng, first_row=1)
 
-        while added < num_shortcuts and attempts < max_attempts:
-            attempts += 1
-            row = random.randint(1, rows-2)
-            col = random.randint(1, cols-2)
+    @classmethod
+    def _row_masks(cls, row):
+        """
+        This method returns the (open, wall) bitmasks of a row of cells: bit c of open is set if the cell c is a
+        path or a shortcut, and bit c of wall if it is a wall. The row is turned into a text of 0 and 1 with
+        bytes.translate and read as a binary number, without a Python loop per cell.
+        """
 
-            if (maze[row][col] == cls.WALL and cls._is_valid_shortcut(maze, row, col)):
+        row = bytes(row)
+        return int(row.translate(cls._OPEN_BITS)[::-1] or b"0", 2), int(row.translate(cls._WALL_BITS)[::-1] or b"0", 2)
 
-                maze[row][col] = cls.SHORTCUT
-                added += 1
+    @staticmethod
+    def _shortcut_candidates(up, middle, down):
+        """
+        This method returns the bitmask of the cells of a row that are valid shortcuts, from the (open, wall)
+        masks of the row and of the rows above and below it, with the same two cases as _is_valid_shortcut.
+        """
+
+        open_up, wall_up = up
+        open_row, wall_row = middle
+        open_down, wall_down = down
+        horizontal = (open_row << 1) & (open_row >> 1) & wall_up & wall_down
+        vertical = open_up & open_down & (wall_row << 1) & (wall_row >> 1)
+        return wall_row & (horizontal | vertical)
+
+    @staticmethod
+    def _set_bits(mask):
+        """
+        Returns the positions of the set bits of mask, from the lowest one, reading its binary text.
+        """
+
+        bits = bin(mask)[:1:-1]
+        positions = []
+        i = bits.find("1")
+        while i != -1:
+            positions.append(i)
+            i = bits.find("1", i + 1)
+        return positions
+
+    @classmethod
+    def _place_shortcuts(cls, rows_view, candidates, wanted, rng, first_row=0):
+        """
+        This method places up to wanted shortcuts, sampled without replacement from the candidate bitmasks.
+
+        candidates has one bitmask per row, for the rows of rows_view starting at first_row. The candidates are
+        numbered across all the rows, the sampled numbers are turned back into (row, col) with the running totals,
+        and each one is checked again with _is_valid_shortcut just before it is placed, because a shortcut placed
+        earlier can make a neighbour invalid. When at least half of the candidates are needed they are all shuffled;
+        otherwise they are drawn one at a time with a lazy partial Fisher-Yates shuffle, which keeps only the
+        swapped positions in a dict. Every draw is a new candidate and no draw is rejected, so placing n shortcuts
+        takes at most n draws plus one per candidate that turned invalid, whatever the luck of rng.
+
+        Returns:
+            int: The number of shortcuts placed.
+        """
+
+        totals = list(accumulate(mask.bit_count() for mask in candidates))
+        total = totals[-1] if totals else 0
+        if wanted <= 0 or total == 0:
+            return 0
+
+        if wanted * 2 >= total:
+            order = rng.sample(range(total), total)
+        else:
+            def draws():
+                # Fisher-Yates parcial y perezoso: solo se guardan las posiciones intercambiadas
+                swapped = {}
+                for n in range(total):
+                    j = rng.randrange(n, total)
+                    yield swapped.get(j, j)
+                    swapped[j] = swapped.get(n, n)
+            order = draws()
+
+        columns = {}  # Columnas de los candidatos de cada fila, calculadas la primera vez que se usan
+        placed = 0
+        for i in order:
+            k = bisect_right(totals, i)
+            if k not in columns:
+                columns[k] = cls._set_bits(candidates[k])
+            row, col = k + first_row, columns[k][i - (totals[k - 1] if k else 0)]
+            if rows_view[row][col] == cls.WALL and cls._is_valid_shortcut(rows_view, row, col):
+                rows_view[row][col] = cls.SHORTCUT
+                placed += 1
+                if placed == wanted:
+                    break
+        return placed
 
     @classmethod
     def _is_valid_shortcut(cls, maze, row, col):
@@ -205,32 +724,81 @@ class MazeGenerator:
         return (start_pos_used, end_pos_used)
 
     @classmethod
-    def place_random_goal(cls, maze):
+    def place_goal(cls, maze, rng=random, placement=None):
         """
-    This method places a random goal on a path cell in the maze bounds.
+    This method places the goal on a path cell of the maze, chosen by its distance from the top left cell.
 
-    This method iterates through the maze to identify all path cells,
-    then randomly selects one of these cells to place the goal.
-    If no path cells are available, the method returns without placing a goal.
+    The goal is chosen with the placement strategy: the farthest cell, a cell at a distance percentile, or any
+    reachable cell (see _choose_cell). The placement is a tuple (strategy, percentile) and defaults to the one
+    of GameConfig. If no path cell can be reached, the method returns without placing a goal.
 
+    Returns:
+        tuple: The (row, col) of the goal, or None if it was not placed.
         """
 
-        rows = len(maze)
-        cols = len(maze[0])
+        if placement is None:
+            placement = GameConfig.get_goal_placement()
+        if maze[1][1] == cls.WALL:
+            return None  # No hay caminos
 
-        for r in range (1, rows-1):
-            for c in range (1, cols-1):
-                if maze[r][c] == cls.PATH:
-                    path_cells = [(r, c)]
-        
-        if not path_cells:
-            return  # No hay caminos
+        goal = cls._choose_cell(maze, (1, 1), placement, rng)
+        if goal is not None:
+            maze.set(goal[0], goal[1], cls.GOAL)
+        return goal
+
+    @classmethod
+    def place_start(cls, maze, rng=random, placement=None):
+        """
+    This method places the start on a path cell of the maze, chosen by its distance to the goal with the
+    same strategies as place_goal, and removes the previous start if there was one. The placement defaults
+    to the start placement of GameConfig.
+
+    Returns:
+        tuple: The (row, col) of the start, or None if the maze has no goal or no path cell can reach it.
+        """
+
+        if placement is None:
+            placement = GameConfig.get_start_placement()
+        old_start = maze.find(cls.START)
+        while old_start is not None:
+            maze.set(old_start[0], old_start[1], cls.PATH)
+            old_start = maze.find(cls.START)
+
+        goal = maze.find(cls.GOAL)
+        if goal is None:
+            return None
+        start = cls._choose_cell(maze, goal, placement, rng)
+        if start is not None:
+            maze.set(start[0], start[1], cls.START)
+        return start
 
-        goal_pos = random.choice(path_cells)
-        r, c = goal_pos
-        maze[r][c] = cls.GOAL
+    @classmethod
+    def _choose_cell(cls, maze, source, placement, rng):
+        """
+    This method chooses a path cell that can be reached from source, with the given (strategy, percentile).
+    A "random" cell is one draw from the component of source in the open cell index, in constant time once
+    the index exists. The other strategies need the distances: one breadth-first search from source measures
+    every path cell (see CellPlacement) and the cell is taken from them, with ties broken by rng.
+    No strategy ever returns source itself.
+        """
+
+        strategy, percentile = placement
+        if strategy == "random":
+            index = cls.open_cell_index(maze)
+            label = index.component(*source)
+            if label is None:
+                return None
+            return index.sample(maze.cells, label, cls.PATH, rng, exclude=source)
+        return CellPlacement(maze, source, cls.PATH).choose(strategy, percentile, rng)
+
+    @staticmethod
+    def open_cell_index(maze):
+        """
+    This method returns the index of the open cells of the maze, labelled by connected component
+    (see OpenCellIndex). It is built once per maze; generate_maze builds it, so every generated maze has it.
+        """
 
-        cls.goal_position = goal_pos  # ejemplo: cls.goal_position para referenciarla después
+        return OpenCellIndex.for_maze(maze)
         
     @classmethod
     def print_maze(cls, maze):
@@ -249,3 +817,9 @@ class MazeGenerator:
                           '.' if cell == cls.PATH else 
                           '*' for cell in row))
         print()
+
+
+if __name__ == "__main__":
+    # Comparar los algoritmos de generación: python -m config.Generate
+    for algorithm, size, seconds in MazeGenerator.benchmark():
+        print(f"{algorithm:8} {size:5}x{size:<5} {seconds:8.2f} s")
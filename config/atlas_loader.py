@@ -1,8 +1,19 @@
 import json
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 from pathlib import Path
 
 class AtlasLoader:
+    MAX_SCALED_FRAMES = 256  # Frames reescalados guardados (unos 10 tamaños de celda de todos los sprites)
+
+    # Caché compartida por todo el proceso: hojas decodificadas y frames recortados
+    _sheet_cache = {}
+    _frame_cache = {}
+    _scaled_cache = OrderedDict()  # (imagen, frame, ancho, alto, aspecto) -> QPixmap, el más reciente al final
+    _cache_hits = 0
+    _cache_misses = 0
+
     def __init__(self, assets_dir="assets"):
         """
     This function initializes the AtlasLoader with the specified assets directory.
@@ -37,7 +48,10 @@ class AtlasLoader:
     This function  recuperates a specific frame from the given atlas by name, recieving them as parameters.
     This function is useful when you want to access a specific frame from an atlas.
     This method recuperates the frame information for the specified frame name using / and with the provided atlas name. 
-    It then loads the associated image file, takes that specific frame region, and returns it as a QPixmap object.
+    It then takes that specific frame region from the decoded sprite sheet and returns it as a QPixmap object.
+
+    Frames are cached process-wide: the sprite sheet is decoded only once (see _get_sheet) and every
+    later call for the same frame is a dictionary lookup. Use clear_cache() to invalidate it.
 
     Returns:
     QPixmap: The pixmap of the specified frame, or None if the atlas/frame is not found, 
@@ -54,24 +68,147 @@ class AtlasLoader:
             print(f"Frame '{frame_name}' not found in atlas '{atlas_name}'")
             return None
         
-        # Cargar la imagen principal
         image_path = self.assets_dir / atlas["image_path"]
-        if not image_path.exists():
-            print(f"Image file not found: {image_path}")
-            return None
-        
-        pixmap = QPixmap(str(image_path))
-        if pixmap.isNull():
-            print(f"Failed to load image: {image_path}")
+        key = (str(image_path), frame_name)
+        frame = AtlasLoader._frame_cache.get(key)
+        if frame is not None:
+            AtlasLoader._cache_hits += 1
+            return frame
+
+        AtlasLoader._cache_misses += 1
+        pixmap = self._get_sheet(image_path)
+        if pixmap is None:
             return None
         
         # Extraer la región específica
-        return pixmap.copy(
+        frame = pixmap.copy(
             frame_info["x"],
             frame_info["y"],
             frame_info["width"],
             frame_info["height"]
         )
+        AtlasLoader._frame_cache[key] = frame
+        return frame
+
+    def get_scaled_frame(self, atlas_name, frame_name, width, height,
+                         aspect_mode=Qt.AspectRatioMode.IgnoreAspectRatio):
+        """
+    This function returns a frame of an atlas (see get_frame) smooth-scaled to width x height pixels.
+
+    The scaled frames are kept in a shared least-recently-used cache of MAX_SCALED_FRAMES frames, like
+    the levels of a mipmap: each frame is scaled once per size, and drawing it later is a plain copy of
+    pixels instead of a smooth transform on every paint. When the zoom of the maze changes, the frames of
+    the new cell size push out the ones of the sizes not used for the longest time.
+
+    Returns:
+    QPixmap: The scaled frame (the frame itself if it already has that size), or None if it is not found.
+        """
+
+        frame = self.get_frame(atlas_name, frame_name)
+        if frame is None:
+            return None
+        key = (str(self.assets_dir), atlas_name, frame_name, width, height, aspect_mode)
+        return self._get_scaled(key, frame, width, height, aspect_mode)
+
+    def get_scaled_image(self, file_name, width, height,
+                         aspect_mode=Qt.AspectRatioMode.KeepAspectRatio):
+        """
+    This function returns an image of the assets directory that is not part of an atlas (like the icons
+    of the menus) smooth-scaled to width x height pixels. The image is decoded once, like a sprite sheet
+    (see _get_sheet), and the scaled pixmap is kept in the same cache as get_scaled_frame.
+
+    Returns:
+    QPixmap: The scaled image, or None if the file does not exist or cannot be loaded.
+        """
+
+        image_path = self.assets_dir / file_name
+        pixmap = self._get_sheet(image_path)
+        if pixmap is None:
+            return None
+        key = (str(image_path), None, None, width, height, aspect_mode)
+        return self._get_scaled(key, pixmap, width, height, aspect_mode)
+
+    @classmethod
+    def _get_scaled(cls, key, pixmap, width, height, aspect_mode):
+        """
+    This function returns the scaled pixmap stored under key, scaling and storing it if it is not cached,
+    and drops the least recently used one when the cache goes over MAX_SCALED_FRAMES.
+        """
+
+        scaled = cls._scaled_cache.get(key)
+        if scaled is not None:
+            cls._cache_hits += 1
+            cls._scaled_cache.move_to_end(key)
+            return scaled
+
+        cls._cache_misses += 1
+        if pixmap.width() == width and pixmap.height() == height:
+            scaled = pixmap
+        else:
+            scaled = pixmap.scaled(width, height, aspect_mode, Qt.TransformationMode.SmoothTransformation)
+        cls._scaled_cache[key] = scaled
+        if len(cls._scaled_cache) > cls.MAX_SCALED_FRAMES:
+            cls._scaled_cache.popitem(last=False)
+        return scaled
+
+    def _get_sheet(self, image_path):
+        """
+    This function returns the decoded sprite sheet for the given image path.
+    The PNG is read from disk the first time it is requested and kept in the shared sheet cache,
+    so each sheet is decoded once per process.
+
+    Returns:
+    QPixmap: The decoded sheet, or None if the file does not exist or cannot be loaded.
+        """
+
+        key = str(image_path)
+        sheet = AtlasLoader._sheet_cache.get(key)
+        if sheet is not None:
+            return sheet
+
+        if not image_path.exists():
+            print(f"Image file not found: {image_path}")
+            return None
+        
+        sheet = QPixmap(key)
+        if sheet.isNull():
+            print(f"Failed to load image: {image_path}")
+            return None
+
+        AtlasLoader._sheet_cache[key] = sheet
+        return sheet
+
+    @classmethod
+    def clear_cache(cls):
+        """
+    This function invalidates the shared sprite cache, dropping every decoded sheet, sliced frame and
+    scaled frame, and resetting the hit/miss counters. The next get_frame call will decode the sheet again.
+    It should be called if an image in the assets folder changes while the game is running.
+        """
+
+        cls._sheet_cache.clear()
+        cls._frame_cache.clear()
+        cls._scaled_cache.clear()
+        cls._cache_hits = 0
+        cls._cache_misses = 0
+
+    @classmethod
+    def get_cache_stats(cls):
+        """
+    This function returns the counters of the shared sprite cache.
+
+    Returns:
+        dict: hits and misses of get_frame and the scaled getters, and the number of cached sheets,
+        frames and scaled frames.
+        """
+
+        return {
+            "hits": cls._cache_hits,
+            "misses": cls._cache_misses,
+            "sheets": len(cls._sheet_cache),
+            "frames": len(cls._frame_cache),
+            "scaled": len(cls._scaled_cache)
+        }
     
     def get_all_frames(self, atlas_name):
         """
@@ -0,0 +1,114 @@
+from pathlib import Path
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+from config.maze_worker import MazeWorker
+
+
+class BackgroundCache:
+    WIDTH, HEIGHT = 1000, 800  # Tamaño de la ventana
+    BACKGROUNDS = ("bg_intro.png", "bg_game_mode.png", "bg_maze.png")
+    ASSETS_DIR = Path("assets")
+
+    # Caché compartida por todo el proceso
+    _pixmaps = {}   # nombre -> QPixmap ya escalado (solo en el hilo de la interfaz)
+    _images = {}    # nombre -> QImage escalado por el worker, pendiente de pasar a QPixmap
+    _pending = set()  # Nombres que el worker todavía está cargando
+    _worker = None
+
+    @classmethod
+    def get(cls, file_name):
+        """
+    This function returns the background image file_name of the assets folder, scaled to cover the window.
+
+    Every background is a PNG of about 2 MB, so it is decoded and smooth-scaled to WIDTH x HEIGHT only once
+    per process, and every screen that uses it (and every new MazeWidget) gets the same cached pixmap.
+    If the background is being loaded by warm, this waits for that one to be loaded instead of decoding it again.
+
+    Returns:
+    QPixmap: The scaled background, or None if the file does not exist or cannot be loaded.
+        """
+
+        pixmap = cls._pixmaps.get(file_name)
+        if pixmap is not None:
+            return pixmap
+
+        while file_name in cls._pending and cls._worker is not None:
+            if cls._worker.wait(5):  # El worker ya terminó (o fue cancelado)
+                break
+        image = cls._images.pop(file_name, None)
+        if image is None:
+            image = cls._load(file_name)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        cls._pixmaps[file_name] = pixmap
+        return pixmap
+
+    @classmethod
+    def _load(cls, file_name):
+        """
+    This function decodes a background and scales it to cover WIDTH x HEIGHT, keeping its aspect.
+    It only uses QImage, so it can run outside the GUI thread.
+
+    Returns:
+    QImage: The scaled image, or None if the file does not exist or cannot be loaded.
+        """
+
+        image = QImage(str(cls.ASSETS_DIR / file_name))
+        if image.isNull():
+            print(f"Failed to load background: {file_name}")
+            return None
+        return image.scaled(
+            cls.WIDTH, cls.HEIGHT,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+    @classmethod
+    def warm(cls, file_names=BACKGROUNDS):
+        """
+    This method loads in a background MazeWorker the backgrounds that are not cached yet, so the screens
+    that need them later (like the maze screen) do not wait for the decoding. Only one warm runs at a time.
+        """
+
+        if cls._worker is not None:
+            return
+        missing = [name for name in file_names if name not in cls._pixmaps and name not in cls._images]
+        if not missing:
+            return
+
+        def load_task(worker):
+            for name in missing:
+                if worker.is_cancelled():
+                    break
+                image = cls._load(name)
+                if image is not None:
+                    cls._images[name] = image
+                cls._pending.discard(name)
+
+        cls._pending.update(missing)
+        cls._worker = MazeWorker(load_task)
+        cls._worker.finished.connect(cls._on_warm_finished)
+        cls._worker.start()
+
+    @classmethod
+    def _on_warm_finished(cls):
+        """
+    This method forgets the worker of warm once its thread has finished.
+        """
+
+        cls._worker = None
+        cls._pending.clear()
+
+    @classmethod
+    def clear(cls):
+        """
+    This method drops every cached background. The next get call will decode it again.
+        """
+
+        if cls._worker is not None:
+            cls._worker.cancel()
+            cls._worker.wait()
+            cls._on_warm_finished()
+        cls._pixmaps.clear()
+        cls._images.clear()
@@ -0,0 +1,92 @@
+from array import array
+from bisect import bisect_left, bisect_right
+import random
+
+
+class CellPlacement:
+    # Estrategias para elegir una celda según su distancia al origen
+    STRATEGIES = ("farthest", "percentile", "random")
+    DEFAULT_PERCENTILE = 0.75
+
+    def __init__(self, maze, source, candidate_value=1):
+        """
+    Initializes the distances of a maze (a MazeGrid) from one source cell, used to place the goal or the start.
+
+    A single breadth-first search from source walks every open cell it can reach (every cell that is not a wall)
+    and stores its distance in steps. The cells with the candidate value (a path cell by default) are kept in
+    the order the search reached them, which is also the order of their distances, so every strategy of choose
+    is answered from that list without sorting it or walking the maze again: the whole pass is O(cells).
+
+    Attributes:
+        distances (array): The distance of each cell from source (row * cols + col), or -1 if it is not reached.
+        candidates (list): The cell indexes with the candidate value reached by the search, from nearest to farthest.
+        """
+
+        self.rows = maze.rows
+        self.cols = maze.cols
+        self.source = source
+        self.distances = array('i', [-1]) * (self.rows * self.cols)
+        self.candidates = []
+        self._build(maze.cells, candidate_value)
+
+    def _build(self, cells, candidate_value):
+        """
+    This method runs the breadth-first search from the source and collects the candidate cells.
+        """
+
+        rows, cols = self.rows, self.cols
+        distances, candidates = self.distances, self.candidates
+        source = self.source[0] * cols + self.source[1]
+        distances[source] = 0
+        queue = [source]
+        for i in queue:  # La lista crece mientras se recorre: cola BFS sin deque
+            if cells[i] == candidate_value and i != source:
+                candidates.append(i)
+            d = distances[i] + 1
+            row, col = divmod(i, cols)
+            for n in (i - cols if row > 0 else -1, i - 1 if col > 0 else -1,
+                      i + cols if row < rows - 1 else -1, i + 1 if col < cols - 1 else -1):
+                if n >= 0 and cells[n] and distances[n] < 0:
+                    distances[n] = d
+                    queue.append(n)
+
+    def distance(self, row, col):
+        """
+    Returns the number of steps from the source to (row, col), or None if it cannot be reached.
+        """
+
+        d = self.distances[row * self.cols + col]
+        return d if d >= 0 else None
+
+    def choose(self, strategy="random", percentile=DEFAULT_PERCENTILE, rng=random):
+        """
+    This method chooses a candidate cell with the given strategy:
+    - "farthest": a cell at the largest distance from the source (the hardest goal).
+    - "percentile": a cell at the distance found at that percentile (0 to 1) of the candidates, nearest first,
+      so 0.5 gives a cell at the median distance and 1 is the same as "farthest".
+    - "random": any reachable candidate, with the same chance for all of them.
+    Several cells can be at the chosen distance; one of them is taken with rng.
+    If the strategy is not valid, it raise a valueerror for that error.
+
+    Returns:
+        tuple: The (row, col) of the cell, or None if there is no candidate.
+        """
+
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Estrategia de colocación no valida: {strategy}")
+        candidates = self.candidates
+        if not candidates:
+            return None
+
+        if strategy == "random":
+            i = rng.choice(candidates)
+        else:
+            if strategy == "farthest":
+                percentile = 1
+            target = self.distances[candidates[round(percentile * (len(candidates) - 1))]]
+            # Las candidatas están ordenadas por distancia: las de la distancia elegida son contiguas
+            key = self.distances.__getitem__
+            first = bisect_left(candidates, target, key=key)
+            last = bisect_right(candidates, target, key=key)
+            i = candidates[rng.randrange(first, last)]
+        return divmod(i, self.cols)
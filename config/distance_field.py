@@ -0,0 +1,145 @@
+from array import array
+import weakref
+
+
+class DistanceField:
+    # Dirección desde cada celda hacia la meta: arriba, izquierda, abajo, derecha (como MazeSolver)
+    DIRECTIONS = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+    NO_DIRECTION = 255
+    GOAL = 4  # Mismo valor que MazeGenerator.GOAL
+
+    # Campos ya calculados de cada laberinto (se liberan junto con el laberinto)
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, maze):
+        """
+    Initializes the distance field of a maze (a MazeGrid), rooted at its goal.
+
+    A single breadth-first search from the goal stores, for every open cell, its distance to the goal
+    and the direction of the next step towards it. Since the goal does not move, the shortest route
+    from any start point is then read by following those directions, in O(path length), instead of
+    searching the maze again every time the start point changes. The same data answers in constant
+    time how far a cell is from the exit and which way to go.
+
+    The field remembers the wall_version and goal of the maze it was built for (see is_valid_for).
+        """
+
+        self.rows = maze.rows
+        self.cols = maze.cols
+        self.goal = maze.find(self.GOAL)
+        self.wall_version = maze.wall_version
+        self.distances = array('i', [-1]) * (self.rows * self.cols)
+        self.steps = bytearray([self.NO_DIRECTION]) * (self.rows * self.cols)
+        if self.goal is not None:
+            self._build(maze.cells)
+
+    @classmethod
+    def for_maze(cls, maze):
+        """
+    Returns the distance field of the maze, reusing the cached one unless the walls or the goal changed
+    since it was built.
+
+    Returns:
+        DistanceField: The field of the maze.
+        """
+
+        field = cls._cache.get(maze)
+        if field is None or not field.is_valid_for(maze):
+            field = cls(maze)
+            cls._cache[maze] = field
+        return field
+
+    @classmethod
+    def cached(cls, maze):
+        """
+    Returns the cached distance field of the maze if it is still valid, or None, without building it.
+        """
+
+        field = cls._cache.get(maze)
+        if field is None or not field.is_valid_for(maze):
+            return None
+        return field
+
+    def is_valid_for(self, maze):
+        """
+    Returns True if the field still matches the walls and the goal of the maze.
+    The goal is checked by reading only the cell where it was when the field was built, so the check takes
+    constant time; only a field of a maze that had no goal has to look for one in the whole grid.
+        """
+
+        if self.wall_version != maze.wall_version or self.rows != maze.rows or self.cols != maze.cols:
+            return False
+        if self.goal is None:
+            return maze.find(self.GOAL) is None
+        return maze.get(*self.goal) == self.GOAL
+
+    def _build(self, cells):
+        """
+    This method runs the breadth-first search from the goal over the open cells (every cell that is not a wall).
+    For each cell reached it stores the distance and the direction that goes back to the cell it was reached from.
+        """
+
+        rows, cols = self.rows, self.cols
+        distances, steps = self.distances, self.steps
+        goal = self.goal[0] * cols + self.goal[1]
+        distances[goal] = 0
+        queue = [goal]
+        for i in queue:  # La lista crece mientras se recorre: cola BFS sin deque
+            d = distances[i] + 1
+            row, col = divmod(i, cols)
+            # (vecino, dirección del vecino hacia i)
+            if row > 0 and cells[i - cols] and distances[i - cols] < 0:
+                distances[i - cols] = d
+                steps[i - cols] = 2
+                queue.append(i - cols)
+            if col > 0 and cells[i - 1] and distances[i - 1] < 0:
+                distances[i - 1] = d
+                steps[i - 1] = 3
+                queue.append(i - 1)
+            if row < rows - 1 and cells[i + cols] and distances[i + cols] < 0:
+                distances[i + cols] = d
+                steps[i + cols] = 0
+                queue.append(i + cols)
+            if col < cols - 1 and cells[i + 1] and distances[i + 1] < 0:
+                distances[i + 1] = d
+                steps[i + 1] = 1
+                queue.append(i + 1)
+
+    def distance(self, row, col):
+        """
+    Returns the number of steps from (row, col) to the goal, or None if the goal cannot be reached from it.
+        """
+
+        d = self.distances[row * self.cols + col]
+        return d if d >= 0 else None
+
+    def exit_direction(self, row, col):
+        """
+    Returns the (drow, dcol) step that moves from (row, col) one cell closer to the goal, or None if the
+    cell is the goal or the goal cannot be reached from it.
+        """
+
+        step = self.steps[row * self.cols + col]
+        if step == self.NO_DIRECTION:
+            return None
+        return self.DIRECTIONS[step]
+
+    def path_from(self, start, max_steps=None):
+        """
+    Returns the shortest route from start to the goal as a list of (row, col) tuples, or None if the goal
+    cannot be reached. If max_steps is given, only the first max_steps steps of the route are returned.
+        """
+
+        if start is None or self.distance(*start) is None:
+            return None
+
+        row, col = start
+        path = [(row, col)]
+        remaining = self.distances[row * self.cols + col]
+        if max_steps is not None:
+            remaining = min(remaining, max_steps)
+        for _ in range(remaining):
+            drow, dcol = self.DIRECTIONS[self.steps[row * self.cols + col]]
+            row, col = row + drow, col + dcol
+            path.append((row, col))
+        return path
@@ -1,6 +1,22 @@
 class GameConfig:
+    MIN_MAZE_SIZE = 3
+    MAX_MAZE_SIZE = 50           # Tamaño máximo del nivel "standard"
+    LARGE_MAZE_MAX_SIZE = 2001   # Tamaño máximo del nivel "large"
+
+    # Algoritmos de generación disponibles (ver MazeGenerator.ALGORITHMS)
+    GENERATION_ALGORITHMS = ("dfs", "kruskal", "prim", "wilson", "eller")
+    DEFAULT_GENERATION_ALGORITHM = "dfs"
+
+    # Estrategias para colocar la meta y el inicio (ver CellPlacement): (estrategia, percentil)
+    PLACEMENT_STRATEGIES = ("farthest", "percentile", "random")
+    DEFAULT_PLACEMENT = ("random", 0.75)
+
     _game_mode = None
     _maze_size = None
+    _generation_algorithm = DEFAULT_GENERATION_ALGORITHM
+    _shortcut_density = None
+    _goal_placement = DEFAULT_PLACEMENT
+    _start_placement = DEFAULT_PLACEMENT
     
     @classmethod
     def set_game_mode(cls, mode):
@@ -32,14 +48,16 @@ class GameConfig:
     def set_maze_size(cls, size):
         """
     This function sets the size of the maze when the user clicks the size or when it loads the game.
+    Sizes up to MAX_MAZE_SIZE belong to the "standard" tier, and bigger sizes up to
+    LARGE_MAZE_MAX_SIZE belong to the "large maze" tier (see get_size_tier).
     If the size is not within the valid range, it raise a valueerror for that error.
     It does not return anything, it only sets the attribute. 
 
         """
-        if size is None or (isinstance(size, int) and 3 <= size <= 50):
+        if size is None or (isinstance(size, int) and cls.MIN_MAZE_SIZE <= size <= cls.LARGE_MAZE_MAX_SIZE):
             cls._maze_size = size
         else:
-            raise ValueError("Tamaño debe ser None o entero entre 3 y 50")
+            raise ValueError(f"Tamaño debe ser None o entero entre {cls.MIN_MAZE_SIZE} y {cls.LARGE_MAZE_MAX_SIZE}")
 
     @classmethod
     def get_maze_size(cls):
@@ -55,12 +73,139 @@ class GameConfig:
             raise ValueError("Tamaño no ha sido establecido")
         return cls._maze_size
 
+    @classmethod
+    def get_size_tier(cls, size=None):
+        """
+    This function sends the size tier of the given size, or of the configured maze size if no size is given.
+    Mazes up to MAX_MAZE_SIZE are "standard" and bigger ones are "large". Large mazes are too big
+    to enumerate every solution, so only their shortest route is calculated.
+    An even size is generated with one more row and column (the grid has odd sides), so sizes are compared
+    as the odd side they generate: the rows of a maze (51 for a size of 50) give the same tier as its size.
+
+    Returns:
+        str: "standard" or "large".
+        """
+
+        if size is None:
+            size = cls.get_maze_size()
+        # n | 1 es el lado impar que genera un tamaño n (50 -> 51)
+        return "standard" if size | 1 <= cls.MAX_MAZE_SIZE | 1 else "large"
+
+    @classmethod
+    def set_generation_algorithm(cls, algorithm):
+        """
+    This function sets the algorithm used to generate the mazes: "dfs" (recursive backtracker, long corridors),
+    "kruskal", "prim", "wilson" (uniform spanning tree) or "eller" (one row at a time).
+    If the algorithm is not one of them, it raise a valueerror for that error.
+    It does not return anything, it only sets the attribute.
+        """
+
+        if algorithm in cls.GENERATION_ALGORITHMS:
+            cls._generation_algorithm = algorithm
+        else:
+            raise ValueError(f"Algoritmo de generacion no valido. Use uno de {', '.join(cls.GENERATION_ALGORITHMS)}")
+
+    @classmethod
+    def get_generation_algorithm(cls):
+        """
+    This function sends the configured generation algorithm ("dfs" unless another one was set).
+
+    Returns:
+        str: The name of the algorithm.
+        """
+
+        return cls._generation_algorithm
+
+    @classmethod
+    def set_shortcut_density(cls, density):
+        """
+    This function sets how many shortcuts the generated mazes have, as shortcuts per cell (between 0 and 1).
+    Every shortcut adds one cycle to the maze, so density * rows * cols is also the number of cycles.
+    With None the default is used: one shortcut every few rows (see MazeGenerator.shortcut_count).
+    If the density is not valid, it raise a valueerror for that error.
+        """
+
+        if density is None or (isinstance(density, (int, float)) and 0 <= density <= 1):
+            cls._shortcut_density = density
+        else:
+            raise ValueError("La densidad de atajos debe ser None o un número entre 0 y 1")
+
+    @classmethod
+    def get_shortcut_density(cls):
+        """
+    This function sends the configured shortcut density, or None if the default number of shortcuts is used.
+        """
+
+        return cls._shortcut_density
+
+    @classmethod
+    def _check_placement(cls, strategy, percentile):
+        """
+    This function checks a placement strategy and its percentile, and raise a valueerror if they are not valid.
+        """
+
+        if strategy not in cls.PLACEMENT_STRATEGIES:
+            raise ValueError(f"Estrategia de colocación no valida. Use una de {', '.join(cls.PLACEMENT_STRATEGIES)}")
+        if not (isinstance(percentile, (int, float)) and 0 <= percentile <= 1):
+            raise ValueError("El percentil debe ser un número entre 0 y 1")
+
+    @classmethod
+    def set_goal_placement(cls, strategy, percentile=DEFAULT_PLACEMENT[1]):
+        """
+    This function sets how the goal of the generated mazes is placed, measured by its distance from the top left cell:
+    "farthest" (as far as possible), "percentile" (at the given percentile of the distances, from 0 to 1)
+    or "random" (any reachable path cell). A farther goal gives a harder maze.
+    If the strategy or the percentile are not valid, it raise a valueerror for that error.
+        """
+
+        cls._check_placement(strategy, percentile)
+        cls._goal_placement = (strategy, percentile)
+
+    @classmethod
+    def get_goal_placement(cls):
+        """
+    This function sends the goal placement as a tuple (strategy, percentile).
+        """
+
+        return cls._goal_placement
+
+    @classmethod
+    def set_start_placement(cls, strategy, percentile=DEFAULT_PLACEMENT[1]):
+        """
+    This function sets how a random start point is placed, with the same strategies as set_goal_placement,
+    measured by its distance to the goal.
+    If the strategy or the percentile are not valid, it raise a valueerror for that error.
+        """
+
+        cls._check_placement(strategy, percentile)
+        cls._start_placement = (strategy, percentile)
+
+    @classmethod
+    def get_start_placement(cls):
+        """
+    This function sends the start placement as a tuple (strategy, percentile).
+        """
+
+        return cls._start_placement
+
     @classmethod
     def reset(cls):
         """
         Resets the game configuration to its default state.
         This method sets the game mode and maze size to None, effectively
-        discarding any previous configuration.
+        discarding any previous configuration. The generation preferences (including the shortcut
+        density) are kept, see reset_generation_settings.
         """
         cls._game_mode = None
-        cls._maze_size = None
\ No newline at end of file
+        cls._maze_size = None
+
+    @classmethod
+    def reset_generation_settings(cls):
+        """
+        Resets the generation preferences to their defaults: the generation algorithm, the shortcut density
+        and the goal and start placements. They are not changed by reset, so a preference chosen once stays for every game.
+        """
+        cls._generation_algorithm = cls.DEFAULT_GENERATION_ALGORITHM
+        cls._shortcut_density = None
+        cls._goal_placement = cls.DEFAULT_PLACEMENT
+        cls._start_placement = cls.DEFAULT_PLACEMENT
\ No newline at end of file
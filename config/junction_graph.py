@@ -0,0 +1,222 @@
+import heapq
+
+
+class JunctionGraph:
+    # Celdas por las que se puede pasar: camino (1), atajo (2), inicio (3) o meta (4)
+    OPEN_CELLS = (1, 2, 3, 4)
+
+    def __init__(self, maze, start, goal, directions=((-1, 0), (0, -1), (1, 0), (0, 1))):
+        """
+    Initializes the corridor-compressed graph of the part of the maze reachable from start.
+
+    Most open cells of a generated maze are corridor cells with exactly two open neighbours, and a
+    search that moves one cell at a time spends almost all its steps walking them. This graph keeps
+    as nodes only the cells where something can happen: junctions (3 or 4 open neighbours), dead ends
+    (0 or 1), and the start and goal. Every corridor between two nodes becomes one weighted edge that
+    keeps its expanded list of cells, so searches run over the nodes and the cells are only rebuilt
+    (see expand) when a path has to be shown.
+
+    Parallel corridors between the same two nodes are kept as different edges, since they give
+    different paths. Corridors that leave a node and come back to it are dropped, because a path
+    that does not repeat cells can never use them.
+    The edges of each node are ordered like the given directions, so a depth-first search over the
+    graph finds the paths in the same order as a search over the cells.
+
+    Attributes:
+        nodes (list): The (row, col) cell of each node; the node id is its position in the list.
+        node_ids (dict): The node id of each node cell.
+        edges (list): For each edge id, a tuple (u, v, cells) where cells goes from the cell of node u to the cell of node v.
+        adjacency (list): For each node id, a list of (neighbour id, edge id, forward) in direction order,
+            where forward tells if the edge is walked from u to v.
+        start (int): Node id of the start.
+        goal (int): Node id of the goal, or None if it cannot be reached from the start.
+        """
+
+        self.maze = maze
+        self.rows = maze.rows
+        self.cols = maze.cols
+        self.directions = list(directions)
+        self.nodes = []
+        self.node_ids = {}
+        self.edges = []
+        self.adjacency = []
+        self._build(start, goal)
+        self.start = self.node_ids[start]
+        self.goal = self.node_ids.get(goal)
+
+    def _open_neighbors(self, x, y):
+        """
+    Returns the open cells next to (x, y), in direction order, with the index of the direction used to reach them.
+        """
+
+        cells = self.maze.cells
+        rows, cols = self.rows, self.cols
+        neighbors = []
+        for d, (dx, dy) in enumerate(self.directions):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < rows and 0 <= ny < cols and cells[nx * cols + ny] in self.OPEN_CELLS:
+                neighbors.append((d, (nx, ny)))
+        return neighbors
+
+    def _add_node(self, cell):
+        """
+    Adds a node for the given cell, if it is not a node already, and returns its id.
+        """
+
+        node = self.node_ids.get(cell)
+        if node is None:
+            node = len(self.nodes)
+            self.node_ids[cell] = node
+            self.nodes.append(cell)
+            self.adjacency.append([])
+        return node
+
+    def _build(self, start, goal):
+        """
+    This method walks every corridor reachable from the start once and records the nodes and edges.
+
+    Starting from the start node, it follows each open direction of a node cell by cell until it reaches
+    a cell that is a node (a cell that is not a corridor, the start or the goal). Both ends of a corridor
+    are marked as walked, so the same corridor is not walked again from its other end.
+        """
+
+        walked = set()  # (celda del nodo, primera celda del corredor) ya recorridos
+        order = []      # (nodo, dirección, vecino, arista, sentido) para ordenar las aristas
+
+        self._add_node(start)
+        queue = [start]
+        while queue:
+            node_cell = queue.pop()
+            u = self.node_ids[node_cell]
+            for d, first in self._open_neighbors(*node_cell):
+                if (node_cell, first) in walked:
+                    continue
+
+                # Recorrer el corredor hasta llegar a otro nodo
+                corridor = [node_cell, first]
+                prev, cell = node_cell, first
+                while True:
+                    if cell == start or cell == goal or cell in self.node_ids:
+                        break
+                    neighbors = self._open_neighbors(*cell)
+                    if len(neighbors) != 2:
+                        break
+                    step = neighbors[0][1] if neighbors[0][1] != prev else neighbors[1][1]
+                    prev, cell = cell, step
+                    corridor.append(cell)
+
+                walked.add((node_cell, first))
+                walked.add((cell, corridor[-2]))
+                if cell == node_cell:
+                    continue  # Corredor que vuelve al mismo nodo: ningún camino simple lo usa
+
+                is_new = cell not in self.node_ids
+                v = self._add_node(cell)
+                if is_new:
+                    queue.append(cell)
+                edge = len(self.edges)
+                self.edges.append((u, v, corridor))
+                order.append((u, d, v, edge, True))
+                back = self.directions.index((corridor[-2][0] - cell[0], corridor[-2][1] - cell[1]))
+                order.append((v, back, u, edge, False))
+
+        order.sort(key=lambda item: (item[0], item[1]))
+        for node, _, neighbor, edge, forward in order:
+            self.adjacency[node].append((neighbor, edge, forward))
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    def weight(self, edge):
+        """
+    Returns the length of an edge, in steps between cells.
+        """
+
+        return len(self.edges[edge][2]) - 1
+
+    def edge_cells(self, edge, forward=True):
+        """
+    Returns the cells of an edge, from its u node to its v node, or reversed if forward is False.
+        """
+
+        cells = self.edges[edge][2]
+        return cells if forward else cells[::-1]
+
+    def expand(self, steps):
+        """
+    This method rebuilds the cell path of a path of the graph that begins at the start node.
+
+    The steps parameter is the list of (edge id, forward) walked from the start. Each corridor is added
+    without its first cell, which is the last cell of the previous one.
+
+    Returns:
+        list: The path as a list of (row, col) tuples.
+        """
+
+        path = [self.nodes[self.start]]
+        for edge, forward in steps:
+            path.extend(self.edge_cells(edge, forward)[1:])
+        return path
+
+    def shortest_path(self):
+        """
+    Finds the shortest route from the start to the goal with Dijkstra's algorithm over the nodes,
+    using the corridor lengths as weights, and expands it to cells.
+
+    Returns:
+        list: The path as a list of (row, col) tuples, or None if the goal cannot be reached.
+        """
+
+        if self.goal is None:
+            return None
+
+        costs = {self.start: 0}
+        parents = {self.start: None}
+        heap = [(0, self.start)]
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node == self.goal:
+                break
+            if cost > costs[node]:
+                continue
+            for neighbor, edge, forward in self.adjacency[node]:
+                new_cost = cost + self.weight(edge)
+                if new_cost < costs.get(neighbor, new_cost + 1):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = (node, edge, forward)
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+        if self.goal not in parents:
+            return None
+
+        steps = []
+        node = self.goal
+        while parents[node] is not None:
+            node, edge, forward = parents[node]
+            steps.append((edge, forward))
+        steps.reverse()
+        return self.expand(steps)
+
+    def statistics(self):
+        """
+    Returns a summary of the graph as a dictionary: number of nodes, junctions, dead ends, edges,
+    open cells reachable from the start, and how many of them are inside corridors.
+        """
+
+        junctions = dead_ends = 0
+        for node in range(self.node_count):
+            degree = len(self._open_neighbors(*self.nodes[node]))
+            if degree >= 3:
+                junctions += 1
+            elif degree <= 1:
+                dead_ends += 1
+        corridor_cells = sum(len(cells) - 2 for _, _, cells in self.edges)
+        return {
+            "nodes": self.node_count,
+            "junctions": junctions,
+            "dead_ends": dead_ends,
+            "edges": len(self.edges),
+            "cells": self.node_count + corridor_cells,
+            "corridor_cells": corridor_cells
+        }
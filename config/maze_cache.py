@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+
+
+class MazeCache:
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB de celdas
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+    Initializes a least-recently-used cache of generated mazes, limited by the memory of their cells.
+
+    The keys describe how a maze was made, for example (algorithm, rows, cols, seed, imperfection settings),
+    so asking again for the same board returns it at once instead of carving it again. Mazes are MazeGrid
+    objects and can be changed by the game (the start point is written on them), so the cache keeps its own
+    copy and every get returns a new copy; copying a MazeGrid is a single memory copy.
+    When the total size goes over max_bytes, the least recently used mazes are dropped.
+    The cache is shared by the generation workers (the maze pool and the game), so every change of the
+    entries and of nbytes is done holding a lock; the copies of the mazes are made outside of it.
+        """
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+    Returns a copy of the maze stored with the given key, or None if it is not in the cache.
+        """
+
+        with self._lock:
+            maze = self._entries.get(key)
+            if maze is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return maze.copy()  # Las entradas no se modifican: se copian fuera del lock
+
+    def put(self, key, maze):
+        """
+    Stores a copy of the maze with the given key, and drops the least recently used mazes if the cache
+    goes over max_bytes. Mazes bigger than max_bytes are not stored.
+        """
+
+        if maze.nbytes > self.max_bytes:
+            return
+        maze = maze.copy()
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = maze
+            self.nbytes += maze.nbytes
+            while self.nbytes > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self.nbytes -= dropped.nbytes
+
+    def clear(self):
+        """
+    Removes every maze from the cache.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def get_stats(self):
+        """
+    Returns the counters of the cache.
+
+    Returns:
+        dict: hits and misses of get, the number of cached mazes and the bytes they use.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "mazes": len(self._entries),
+                "bytes": self.nbytes
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,211 @@
+class MazeGrid:
+    WALL = 0  # Mismo valor que MazeGenerator.WALL
+
+    def __init__(self, rows, cols, fill=0, cells=None):
+        """
+    Initializes a maze grid of the given number of rows and columns.
+
+    The cells are stored row by row in one contiguous bytearray (one unsigned byte per cell,
+    the same WALL, PATH, SHORTCUT, START and GOAL values used by MazeGenerator), instead of a
+    list of lists of Python ints. Copying the grid is a single memory copy and a 2001x2001 maze
+    takes 4 MB. If cells is given it is used as the storage (it must have rows * cols bytes),
+    otherwise every cell is set to fill.
+
+    The grid can still be used like the old list of lists: maze[row][col] reads and writes a cell,
+    len(maze) is the number of rows and iterating over it gives the rows.
+
+    wall_version counts the changes of set() that turn a wall into an open cell or the other way round,
+    so data computed from the walls (like a DistanceField) knows when it must be rebuilt. Writes made
+    through maze[row][col] or cells do not count; code that changes walls that way after the maze is
+    built must call walls_changed().
+
+    The algorithm and seed attributes record how a generated maze was made (None if unknown), so the
+    same board can be generated again. open_cells keeps the OpenCellIndex of the maze once it is built
+    (see OpenCellIndex.for_maze).
+        """
+
+        self.rows = rows
+        self.cols = cols
+        if cells is None:
+            cells = bytearray([fill]) * (rows * cols)
+        elif len(cells) != rows * cols:
+            raise ValueError("El tamaño de las celdas no coincide con rows * cols")
+        self.cells = cells
+        self.wall_version = 0
+        self.algorithm = None
+        self.seed = None
+        self.open_cells = None
+
+    @classmethod
+    def from_list(cls, maze):
+        """
+    Creates a grid from a list of lists of ints, like the "map" stored in the old save files.
+    If maze is already a MazeGrid, a copy of it is returned.
+        """
+
+        if isinstance(maze, MazeGrid):
+            return maze.copy()
+        rows = len(maze)
+        cols = len(maze[0]) if rows > 0 else 0
+        cells = bytearray()
+        for row in maze:
+            cells.extend(row)
+        return cls(rows, cols, cells=cells)
+
+    def to_list(self):
+        """
+    Returns the grid as a list of lists of ints, the format used to save the maze in JSON.
+        """
+
+        cols = self.cols
+        return [list(self.cells[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+
+    def copy(self):
+        """
+    Returns an independent copy of the grid. The copy has the same walls, so it keeps the wall_version
+    and shares the open cell index, which is never changed once built.
+        """
+
+        grid = MazeGrid(self.rows, self.cols, cells=bytearray(self.cells))
+        grid.wall_version = self.wall_version
+        grid.algorithm = self.algorithm
+        grid.seed = self.seed
+        grid.open_cells = self.open_cells
+        return grid
+
+    def index(self, row, col):
+        """
+    Returns the position of the cell (row, col) inside the cells bytearray.
+        """
+
+        return row * self.cols + col
+
+    def get(self, row, col):
+        """
+    Returns the value of the cell (row, col).
+        """
+
+        return self.cells[row * self.cols + col]
+
+    def set(self, row, col, value):
+        """
+    Sets the value of the cell (row, col).
+        """
+
+        i = row * self.cols + col
+        if (self.cells[i] == self.WALL) != (value == self.WALL):
+            self.wall_version += 1
+        self.cells[i] = value
+
+    def walls_changed(self):
+        """
+    Records that walls were changed without using set().
+        """
+
+        self.wall_version += 1
+
+    def find(self, value):
+        """
+    Returns the (row, col) of the last cell with the given value, or None if there is none.
+    The search is done over the whole bytearray at once, without a Python loop per cell.
+        """
+
+        i = self.cells.rfind(bytes([value]))
+        if i < 0:
+            return None
+        return divmod(i, self.cols)
+
+    @property
+    def nbytes(self):
+        """
+    Returns the memory used by the cells, in bytes.
+        """
+
+        return len(self.cells)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        # Vista de la fila sin copiar: permite maze[row][col] para leer y escribir
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError("Fila fuera del laberinto")
+        return memoryview(self.cells)[row * self.cols:(row + 1) * self.cols]
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield self[row]
+
+
+class VisitedBitset:
+    def __init__(self, size):
+        """
+    Initializes a set of visited cells stored as bits, one bit per cell of the maze
+    (cells are identified by their MazeGrid.index). It replaces the list of lists of
+    booleans used as visited matrix, and takes 8 times less memory than a byte per cell.
+        """
+
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+
+    def add(self, i):
+        """
+    Marks the cell i as visited.
+        """
+
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, i):
+        """
+    Marks the cell i as not visited.
+        """
+
+        self.bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def clear(self):
+        """
+    Marks every cell as not visited.
+        """
+
+        self.bits = bytearray(len(self.bits))
+
+    def __contains__(self, i):
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+
+class DisjointSet:
+    def __init__(self, size):
+        """
+    Initializes a union-find structure over the elements 0 to size - 1, each one in its own set.
+    It uses path halving and union by size, so find and union take almost constant time.
+        """
+
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, i):
+        """
+    Returns the representative element of the set that contains i.
+        """
+
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Compresión por mitades
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        """
+    Joins the sets that contain a and b. Returns False if they were already in the same set.
+        """
+
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
@@ -0,0 +1,149 @@
+import random
+from collections import deque
+from PyQt6.QtCore import QObject
+from config.game_config import GameConfig
+from config.Generate import MazeGenerator
+from config.distance_field import DistanceField
+from config.maze_worker import MazeWorker
+
+
+class MazePool(QObject):
+    DIFFICULTY_SIZES = (11, 17, 21, 27)  # Easy, Standard, Hard y Extreme
+    MAZES_PER_SIZE = 2
+    MAX_FAILURES = 2  # Generaciones fallidas seguidas antes de dejar de reponer esa clave
+
+    def __init__(self, parent=None):
+        """
+    Initializes a pool of mazes that are generated ahead of time, so starting a new game does not wait
+    for the generation.
+
+    For each difficulty size (and the last custom size that was played), the pool keeps MAZES_PER_SIZE
+    mazes ready, made with the generation algorithm configured in GameConfig. They are generated one at a
+    time in a background MazeWorker, which also builds their DistanceField (the shortest route from any
+    start point), so the mazes come out already solved up to the start point. Every time a maze is taken,
+    the worker starts again to replace it, while the player is in the menus or playing.
+    Large mazes (see GameConfig.get_size_tier) are not kept, they take too long and too much memory.
+        """
+
+        super().__init__(parent)
+        self._ready = {}  # (tamaño, algoritmo, ajustes de generación) -> mazes listos
+        self._failures = {}  # Misma clave -> generaciones fallidas seguidas
+        self.custom_size = None
+        self.worker = None
+        self._worker_key = None
+
+    def _settings(self):
+        return (GameConfig.get_generation_algorithm(),) + MazeGenerator.generation_settings()
+
+    def _key(self, size):
+        return (size,) + self._settings()
+
+    def _wanted_sizes(self):
+        """
+    Returns the sizes the pool keeps ready: the difficulty sizes and the custom size, if any.
+        """
+
+        sizes = list(self.DIFFICULTY_SIZES)
+        if self.custom_size is not None and self.custom_size not in sizes:
+            sizes.append(self.custom_size)
+        return sizes
+
+    def take(self, size):
+        """
+    This method takes a ready maze of the given size out of the pool, and starts refilling the pool.
+    A size that is not a difficulty size becomes the custom size, so it is kept ready from now on.
+
+    Returns:
+        MazeGrid: A generated maze, or None if there is none ready (the caller then generates it).
+        """
+
+        if size not in self.DIFFICULTY_SIZES and GameConfig.get_size_tier(size) == "standard":
+            self.custom_size = size
+        ready = self._ready.get(self._key(size))
+        maze = ready.popleft() if ready else None
+        self.fill()
+        return maze
+
+    def ready_count(self, size):
+        """
+    Returns how many mazes of the given size are ready, for the current generation algorithm and settings.
+        """
+
+        return len(self._ready.get(self._key(size), ()))
+
+    def fill(self):
+        """
+    This method starts generating the next missing maze in the background, unless a generation is already
+    running or the pool is full. The size with fewer ready mazes goes first. A size whose generation failed
+    MAX_FAILURES times in a row (with the current algorithm and settings) is skipped.
+    Mazes made with another algorithm or other generation settings can no longer be taken, so they are dropped
+    first to free their memory.
+        """
+
+        current = self._settings()
+        for stale in [key for key in self._ready if key[1:] != current]:
+            del self._ready[stale]
+        for stale in [key for key in self._failures if key[1:] != current]:
+            del self._failures[stale]
+
+        if self.worker is not None:
+            return
+
+        missing = [size for size in self._wanted_sizes() if self.ready_count(size) < self.MAZES_PER_SIZE
+                   and self._failures.get(self._key(size), 0) < self.MAX_FAILURES]
+        if not missing:
+            return
+        size = min(missing, key=self.ready_count)
+        key = self._key(size)
+        algorithm, settings = key[1], key[2:]  # Se leen aquí: el worker no vuelve a consultar GameConfig
+        seed = random.randrange(2 ** 32)
+
+        def generate_task(worker):
+            maze = MazeGenerator.generate_maze(size, algorithm, seed=seed, settings=settings)
+            DistanceField.for_maze(maze)
+            return key, maze
+
+        self._worker_key = key
+        self.worker = MazeWorker(generate_task)
+        self.worker.result_ready.connect(self._on_maze_ready)
+        self.worker.failed.connect(self._on_worker_failed)
+        self.worker.start()
+
+    def _on_maze_ready(self, result):
+        """
+    This method stores a maze generated by the worker and goes on with the next one.
+        """
+
+        key, maze = result
+        self.worker = None
+        self._worker_key = None
+        self._failures.pop(key, None)
+        self._ready.setdefault(key, deque()).append(maze)
+        self.fill()
+
+    def _on_worker_failed(self, message):
+        """
+    This method reports a failed generation and goes on filling the pool. The same size is tried again,
+    up to MAX_FAILURES times in a row; after that it is skipped and the game generates its own mazes of
+    that size, while the other sizes are still kept ready.
+        """
+
+        key, self._worker_key = self._worker_key, None
+        self.worker = None
+        failures = self._failures.get(key, 0) + 1
+        self._failures[key] = failures
+        action = "se reintenta" if failures < self.MAX_FAILURES else "se deja de reponer"
+        print(f"Error generando laberintos de reserva {key} ({failures}/{self.MAX_FAILURES}, {action}): {message}")
+        self.fill()
+
+    def clear(self):
+        """
+    This method cancels the generation in progress and drops every ready maze.
+        """
+
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+            self._worker_key = None
+        self._ready.clear()
+        self._failures.clear()
@@ -0,0 +1,93 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class MazeWorker(QThread):
+    progress = pyqtSignal(int, int)   # (caminos encontrados, pasos de la búsqueda)
+    result_ready = pyqtSignal(object) # Resultado de la tarea
+    failed = pyqtSignal(str)          # Mensaje de error
+
+    # Workers en ejecución: se guardan aquí para que el hilo no se destruya mientras corre,
+    # aunque el widget que lo lanzó ya haya sido eliminado.
+    _running = set()
+
+    def __init__(self, task):
+        """
+    Initializes a worker thread that runs a long task (maze generation or solving) outside the GUI thread.
+
+    The task parameter is a function that receives the worker and returns the result. While it runs,
+    the task can call report_progress(found, steps) to emit the progress signal, and should check
+    is_cancelled() from time to time to stop early. When the task ends the result_ready signal is emitted
+    with its result (unless the worker was cancelled), or failed with the error message.
+    Signals are delivered in the thread of the receivers, so widgets can update themselves safely.
+        """
+
+        super().__init__()
+        self.task = task
+        self._cancelled = False
+        self.finished.connect(self._forget)
+
+    def start(self):
+        """
+    This method starts running the task in the worker thread.
+
+    Returns:
+        MazeWorker: The worker itself, so it can be cancelled later.
+        """
+
+        MazeWorker._running.add(self)
+        super().start()
+        return self
+
+    def run(self):
+        """
+    This method runs the task in the worker thread and emits result_ready or failed when it ends.
+        """
+
+        try:
+            result = self.task(self)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            if not self._cancelled:
+                self.result_ready.emit(result)
+
+    def cancel(self):
+        """
+    This method asks the task to stop. The task stops the next time it checks is_cancelled(),
+    and the result_ready signal is not emitted.
+        """
+
+        self._cancelled = True
+
+    def is_cancelled(self):
+        """
+    Returns True if the worker was cancelled.
+        """
+
+        return self._cancelled
+
+    def report_progress(self, found, steps):
+        """
+    This method emits the progress signal. It can be used as progress_callback of MazeSolver.iter_solutions.
+        """
+
+        self.progress.emit(found, steps)
+
+    def _forget(self):
+        """
+    This method drops the reference to a worker whose thread has finished.
+        """
+
+        MazeWorker._running.discard(self)
+
+    @classmethod
+    def shutdown(cls):
+        """
+    This method cancels every running worker and waits for their threads to finish.
+    It is called when the application is about to quit.
+        """
+
+        for worker in list(cls._running):
+            worker.cancel()
+            worker.wait()
+        cls._running.clear()
@@ -0,0 +1,140 @@
+from array import array
+import random
+
+
+class OpenCellIndex:
+    PATH = 1  # Mismo valor que MazeGenerator.PATH
+    SAMPLE_ATTEMPTS = 32  # Intentos al azar antes de recorrer la componente
+    _OPEN_TABLE = bytes([0]) + bytes([1]) * 255  # Cualquier valor distinto de muro es una celda abierta
+
+    def __init__(self, maze):
+        """
+    Initializes the index of the open cells of a maze (a MazeGrid), labelled by connected component.
+
+    One flood fill over the maze gives every open cell (every cell that is not a wall) the label of its
+    connected component, and keeps the cells of each component in an array. With it, two cells can reach
+    each other exactly when they have the same label, so checking that a board is solvable is a lookup
+    and not a search, and a random cell that can reach a given one is a single random draw from the array
+    of its component. Start and goal values do not change the walls, so the index stays valid while they
+    move; it remembers the wall_version of the maze it was built for (see is_valid_for).
+
+    Attributes:
+        labels (array): The component of each cell (row * cols + col), or -1 for walls.
+        components (list): For each component, an array with the indexes of its cells.
+        """
+
+        self.rows = maze.rows
+        self.cols = maze.cols
+        self.wall_version = maze.wall_version
+        self.labels = array('i', [-1]) * (self.rows * self.cols)
+        self.components = []
+        self._build(maze.cells)
+
+    @classmethod
+    def for_maze(cls, maze):
+        """
+    Returns the index of the maze, reusing the one stored in maze.open_cells unless the walls changed since
+    it was built. A new index is stored there, and MazeGrid.copy passes it on, so the copies of a generated
+    maze (like the ones of the maze cache) do not build it again.
+
+    Returns:
+        OpenCellIndex: The index of the maze.
+        """
+
+        index = maze.open_cells
+        if index is None or not index.is_valid_for(maze):
+            index = cls(maze)
+            maze.open_cells = index
+        return index
+
+    def is_valid_for(self, maze):
+        """
+    Returns True if the index still matches the walls of the maze.
+        """
+
+        return self.wall_version == maze.wall_version and self.rows == maze.rows and self.cols == maze.cols
+
+    def _build(self, cells):
+        """
+    This method labels the open cells with a flood fill that starts from each open cell not labelled yet.
+    The open cells not labelled yet are marked in a bytearray, so the next one is found with bytearray.find
+    instead of a Python loop over the walls and the cells already labelled.
+        """
+
+        rows, cols = self.rows, self.cols
+        labels = self.labels
+        pending = bytearray(cells.translate(self._OPEN_TABLE))  # 1 = abierta y sin etiqueta
+        i = pending.find(1)
+        while i >= 0:
+            label = len(self.components)
+            labels[i] = label
+            pending[i] = 0
+            queue = [i]
+            for j in queue:  # La lista crece mientras se recorre
+                row, col = divmod(j, cols)
+                for n in (j - cols if row > 0 else -1, j - 1 if col > 0 else -1,
+                          j + cols if row < rows - 1 else -1, j + 1 if col < cols - 1 else -1):
+                    if n >= 0 and pending[n]:
+                        labels[n] = label
+                        pending[n] = 0
+                        queue.append(n)
+            self.components.append(array('i', queue))
+            i = pending.find(1, i + 1)
+
+    def component(self, row, col):
+        """
+    Returns the label of the component of (row, col), or None if it is a wall.
+        """
+
+        label = self.labels[row * self.cols + col]
+        return label if label >= 0 else None
+
+    def connected(self, a, b):
+        """
+    Returns True if the cells a and b, given as (row, col), are open and can reach each other.
+        """
+
+        if a is None or b is None:
+            return False
+        label = self.component(*a)
+        return label is not None and label == self.component(*b)
+
+    def component_size(self, label):
+        """
+    Returns the number of cells of a component.
+        """
+
+        return len(self.components[label])
+
+    def largest_component(self):
+        """
+    Returns the label of the component with the most cells, or None if the maze has no open cells.
+        """
+
+        if not self.components:
+            return None
+        return max(range(len(self.components)), key=self.component_size)
+
+    def sample(self, cells, label, value=PATH, rng=random, exclude=None):
+        """
+    This method draws a random cell of a component that has the given value (a path cell by default).
+    The cell given as exclude (row, col), if any, is never drawn, like the source cell in CellPlacement.
+
+    Almost every cell of a component is a path cell, so a few random draws from the array of the component
+    find one in constant time; only if they all fail (a component with very few path cells) the component
+    is walked in a random order. The cells parameter is the bytearray of the maze, to read the values.
+
+    Returns:
+        tuple: The (row, col) of the cell, or None if the component has no cell with that value.
+        """
+
+        members = self.components[label]
+        skip = exclude[0] * self.cols + exclude[1] if exclude is not None else -1
+        for _ in range(self.SAMPLE_ATTEMPTS):
+            i = members[rng.randrange(len(members))]
+            if cells[i] == value and i != skip:
+                return divmod(i, self.cols)
+        matches = [i for i in members if cells[i] == value and i != skip]
+        if not matches:
+            return None
+        return divmod(rng.choice(matches), self.cols)
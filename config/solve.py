@@ -1,56 +1,376 @@
+from collections import deque
+import heapq
+import time
+from config.maze_grid import MazeGrid, VisitedBitset
+from config.junction_graph import JunctionGraph
+
+
 class MazeSolver:
+    # Celdas por las que se puede pasar: camino (1), atajo (2), inicio (3) o meta (4)
+    OPEN_CELLS = (1, 2, 3, 4)
+
     def __init__(self, maze):
         """
     Initializes the MazeSolver with the provided maze.
 
     This init sets up the maze structure and initializes various attributes 
     required for solving the maze. It creates a  copy of the maze for internal use 
+    (a MazeGrid, so the copy is a single memory copy; a list of lists is also accepted)
     and initializes the start and goal positions as None. The all_paths list will store 
-    all potential paths found, while the visited matrix keeps track of visited cells. 
+    all potential paths found, while the visited bitset keeps track of visited cells
+    (of visited nodes of the junction graph, once the enumeration has started). 
     The shortest_path will store the shortest path found. Directions for movement are 
     representing moves in four  directions: up, left, down, and right.
         """
 
-        self.maze = [row[:] for row in maze]  # Copia del laberinto
-        self.rows = len(maze)
-        self.cols = len(maze[0])
+        self.maze = MazeGrid.from_list(maze)  # Copia del laberinto
+        self.rows = self.maze.rows
+        self.cols = self.maze.cols
         self.goal = None
         self.start = None
         self.all_paths = []
-        self.visited = []
-        for _ in range(self.rows):
-            row = []
-            for _ in range(self.cols):
-                row.append(False)
-            self.visited.append(row)
+        self.visited = VisitedBitset(self.rows * self.cols)
         self.shortest_path = None
         self.directions = [(-1, 0), (0, -1), (1, 0), (0, 1)]  # Arriba, izquierda, abajo, derecha
+        self.search_complete = False
+        self.budget_exhausted = False
+        self.graph = None
+        self._search = None
 
-    def solve(self):
+    def solve(self, max_paths=None, time_budget=None, progress_callback=None):
         """
     Solves the maze by finding and recording all possible paths.
 
     This function first locates the start and goal positions of the maze. 
     If either position is missing, it returns the maze as it is. Using a backtracking 
-    algorithm, it explores all paths from the start to the goal, it uses the visited matrix to keep and control the cells it is visiting or has already visited. 
+    algorithm, it explores all paths from the start to the goal, it uses the visited bitset to keep and control the cells it is visiting or has already visited. 
+    The optional max_paths, time_budget and progress_callback limit the search as in iter_solutions;
+    if the budget runs out, all_paths and shortest_path keep the best results found so far.
     If no path is found, it prints a message and returns the maze, if not, it returns the maze with all potential paths evaluated.
         """
 
-        self._find_start_goal()
+        for _ in self.iter_solutions(max_paths, time_budget, progress_callback):
+            pass
+
         if not self.start or not self.goal:
             return self.maze
 
-        # Inicializar búsqueda
-        sx, sy = self.start
-        self.visited[sx][sy] = True
-        self._backtrack(sx, sy, [(sx, sy)])
-
-        if not self.shortest_path:
+        if not self.shortest_path and self.search_complete:
             print("No path found.")
             return self.maze
 
         return self.maze
 
+    def iter_solutions(self, max_paths=None, time_budget=None, progress_callback=None, is_cancelled=None):
+        """
+    Enumerates the paths from the start to the goal lazily, yielding each one as (path, length) as soon as it is found.
+
+    The search is kept inside the solver, so calling this function again continues where the previous
+    call stopped instead of starting over; each call has its own limits. This lets the caller pull
+    solutions on demand ("Next Solver") without materialising every path first.
+    The search runs over the junction graph of the maze (see get_graph), and each path is expanded
+    to its cells only when it is yielded.
+    - max_paths: stop after yielding this many paths in this call.
+    - time_budget: stop after this many seconds in this call.
+    - progress_callback: called as progress_callback(paths_found, steps) every PROGRESS_INTERVAL steps.
+    - is_cancelled: function checked every PROGRESS_INTERVAL steps; if it returns True the search stops
+      (used to cancel a solve running in a MazeWorker).
+    When a limit stops the search, budget_exhausted is set to True; when every path has been found,
+    search_complete is set to True. Found paths are also recorded in all_paths and shortest_path.
+        """
+
+        if self.search_complete:
+            return
+        if self._search is None:
+            self._find_start_goal()
+            if not self.start or not self.goal:
+                self.search_complete = True
+                return
+            self.get_graph()
+            self._search = self._backtrack()
+
+        self.budget_exhausted = False
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        found = 0
+        for item in self._search:
+            if item is None:
+                # Latido periódico de la búsqueda: revisar presupuesto y reportar progreso
+                if progress_callback:
+                    progress_callback(len(self.all_paths), self._steps)
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.budget_exhausted = True
+                    return
+                if is_cancelled is not None and is_cancelled():
+                    return
+                continue
+
+            yield item
+            found += 1
+            if max_paths is not None and found >= max_paths:
+                self.budget_exhausted = True
+                return
+
+        self.search_complete = True
+
+    def find_shortest_path(self, method="bfs"):
+        """
+    Finds the shortest route from the start to the goal without enumerating every path.
+
+    Unlike solve(), which finds the shortest path only as a side effect of the exhaustive
+    backtracking, this function runs a single search that visits each cell at most once, so it
+    takes linear time in the number of cells even when the maze has many shortcuts.
+    The method parameter chooses the search: "bfs" (breadth-first search), "astar" (A* with a
+    Manhattan distance heuristic), "bidirectional" (BFS from both ends at the same time) or "graph"
+    (Dijkstra over the junction graph, which only visits junctions and dead ends).
+    All of them return an optimal route.
+
+    Returns:
+        list: The path as a list of (row, col) tuples from start to goal, or None if the start or
+        goal are missing or the goal cannot be reached.
+        """
+
+        searches = {
+            "bfs": self._bfs_path,
+            "astar": self._astar_path,
+            "bidirectional": self._bidirectional_bfs_path,
+            "graph": self._graph_path
+        }
+        if method not in searches:
+            raise ValueError(f"Metodo de busqueda no valido: {method}")
+
+        if not self.start or not self.goal:
+            self._find_start_goal()
+        if not self.start or not self.goal:
+            return None
+
+        return searches[method](self.start, self.goal)
+
+    def get_graph(self):
+        """
+    Returns the corridor-compressed junction graph of the maze (see JunctionGraph), building it the first
+    time it is needed. Its statistics() method summarizes the structure of the maze.
+    Returns None if the maze has no start or goal.
+        """
+
+        if self.graph is None:
+            if not self.start or not self.goal:
+                self._find_start_goal()
+            if not self.start or not self.goal:
+                return None
+            self.graph = JunctionGraph(self.maze, self.start, self.goal, self.directions)
+        return self.graph
+
+    def _graph_path(self, start, goal):
+        """
+    Dijkstra search over the junction graph, weighted by the corridor lengths. The path is expanded to cells at the end.
+        """
+
+        return self.get_graph().shortest_path()
+
+    def _open_neighbors(self, x, y):
+        """
+    Returns the cells next to (x, y), in the solver directions, that are inside the maze and can be walked on.
+        """
+
+        cells = self.maze.cells
+        for dx, dy in self.directions:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.rows and 0 <= ny < self.cols and cells[nx * self.cols + ny] in self.OPEN_CELLS:
+                yield (nx, ny)
+
+    @staticmethod
+    def _rebuild_path(parents, end):
+        """
+    Rebuilds a path by following the parents dictionary from end back to the cell whose parent is None.
+    Returns the path ordered from that first cell to end.
+        """
+
+        path = []
+        cell = end
+        while cell is not None:
+            path.append(cell)
+            cell = parents[cell]
+        path.reverse()
+        return path
+
+    def _bfs_path(self, start, goal):
+        """
+    Breadth-first search from start to goal. Since every step costs the same, the first time the
+    goal is reached the path is the shortest one. Each cell is visited at most once.
+        """
+
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            if cell == goal:
+                return self._rebuild_path(parents, goal)
+            for neighbor in self._open_neighbors(*cell):
+                if neighbor not in parents:
+                    parents[neighbor] = cell
+                    queue.append(neighbor)
+        return None
+
+    def _astar_path(self, start, goal):
+        """
+    A* search from start to goal using the Manhattan distance to the goal as heuristic.
+    The heuristic never overestimates the real distance in a 4-direction grid, so the path found is optimal,
+    and cells far away from the goal are usually not expanded at all.
+        """
+
+        gx, gy = goal
+        def heuristic(cell):
+            return abs(cell[0] - gx) + abs(cell[1] - gy)
+
+        parents = {start: None}
+        costs = {start: 0}
+        counter = 0  # Desempate estable para el heap
+        heap = [(heuristic(start), counter, start)]
+        while heap:
+            _, _, cell = heapq.heappop(heap)
+            if cell == goal:
+                return self._rebuild_path(parents, goal)
+            cost = costs[cell] + 1
+            for neighbor in self._open_neighbors(*cell):
+                if cost < costs.get(neighbor, cost + 1):
+                    costs[neighbor] = cost
+                    parents[neighbor] = cell
+                    counter += 1
+                    heapq.heappush(heap, (cost + heuristic(neighbor), counter, neighbor))
+        return None
+
+    def _bidirectional_bfs_path(self, start, goal):
+        """
+    Bidirectional breadth-first search: two searches grow one level at a time, one from the start and one
+    from the goal, always expanding the smaller frontier. When a level touches the other search, the best
+    meeting cell of that level is used to join both halves, which gives a shortest path.
+        """
+
+        if start == goal:
+            return [start]
+
+        parents_start = {start: None}
+        parents_goal = {goal: None}
+        dist_start = {start: 0}
+        dist_goal = {goal: 0}
+        frontier_start = [start]
+        frontier_goal = [goal]
+
+        while frontier_start and frontier_goal:
+            if len(frontier_start) <= len(frontier_goal):
+                frontier, parents, dist, other_dist = frontier_start, parents_start, dist_start, dist_goal
+            else:
+                frontier, parents, dist, other_dist = frontier_goal, parents_goal, dist_goal, dist_start
+
+            next_frontier = []
+            meeting = None
+            for cell in frontier:
+                for neighbor in self._open_neighbors(*cell):
+                    if neighbor in dist:
+                        continue
+                    parents[neighbor] = cell
+                    dist[neighbor] = dist[cell] + 1
+                    next_frontier.append(neighbor)
+                    if neighbor in other_dist:
+                        total = dist[neighbor] + other_dist[neighbor]
+                        if meeting is None or total < meeting[0]:
+                            meeting = (total, neighbor)
+
+            if meeting is not None:
+                middle = meeting[1]
+                first_half = self._rebuild_path(parents_start, middle)
+                second_half = self._rebuild_path(parents_goal, middle)
+                second_half.reverse()
+                return first_half + second_half[1:]
+
+            if frontier is frontier_start:
+                frontier_start = next_frontier
+            else:
+                frontier_goal = next_frontier
+
+        return None
+
+    def iter_backtracking_steps(self):
+        """
+    Runs the backtracking search step by step, for the animation of the search.
+
+    It is a generator that yields (row, col, "*") each time a cell is explored and (row, col, "-")
+    each time the search backtracks out of a cell, in the same order as the exhaustive backtracking
+    of solve(). The caller decides how many steps to take each time (for example a QTimer that takes
+    N steps per frame), so the search can be paused, resumed or abandoned at any moment.
+    It uses its own visited bitset, so it does not interfere with solve() or iter_solutions().
+        """
+
+        if not self.start or not self.goal:
+            self._find_start_goal()
+        if not self.start or not self.goal:
+            return
+
+        cells = self.maze.cells
+        rows, cols = self.rows, self.cols
+        visited = VisitedBitset(rows * cols)
+        sx, sy = self.start
+        visited.add(sx * cols + sy)
+        path = [self.start]
+        pending = [iter(self.directions)]
+
+        while pending:
+            x, y = path[-1]
+            advanced = False
+            if (x, y) != self.goal:
+                for dx, dy in pending[-1]:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < rows and 0 <= ny < cols:
+                        if cells[nx * cols + ny] in self.OPEN_CELLS and nx * cols + ny not in visited:
+                            visited.add(nx * cols + ny)
+                            path.append((nx, ny))
+                            pending.append(iter(self.directions))
+                            advanced = True
+                            break
+
+            if advanced:
+                # Marcar exploración
+                yield (nx, ny, "*")
+                continue
+
+            # Retroceso
+            pending.pop()
+            if pending:
+                nx, ny = path.pop()
+                visited.discard(nx * cols + ny)
+                yield (nx, ny, "-")
+
+    def backtracking_final_cells(self):
+        """
+    Returns the cells that the backtracking animation leaves marked when it finishes, without running it.
+
+    The exhaustive search of iter_backtracking_steps enters every cell that can be reached from the start
+    without walking through the goal (and the goal itself), and backtracks out of all of them, so at the
+    end all those cells are marked with "-". This is computed with a single breadth-first search that does
+    not expand the goal, which lets the animation skip to the end instantly.
+
+    Returns:
+        list: The (row, col) cells marked at the end of the animation (the start is not included).
+        """
+
+        if not self.start or not self.goal:
+            self._find_start_goal()
+        if not self.start or not self.goal:
+            return []
+
+        seen = {self.start}
+        queue = deque([self.start])
+        while queue:
+            cell = queue.popleft()
+            if cell == self.goal:
+                continue
+            for neighbor in self._open_neighbors(*cell):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        seen.discard(self.start)
+        return list(seen)
+
     def get_paths(self):
         """
     Returns the list of all  paths found.
@@ -64,46 +384,85 @@ class MazeSolver:
         
         """
         Finds the start and goal positions in the maze.
-        This method iterates through the maze matrix to find the start and goal points.
-        If the start or goal positions are not found, the attributes will remain None.
+        This method searches the maze grid to find the start and goal points (if a value appears
+        more than once, the last one is used). If the start or goal positions are not found,
+        the attributes will remain None.
         This function is use in the backtracking for finding all possible paths, and for that is necessary to find the start and goal positions.
         """
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.maze[i][j] == 3:  # Punto de inicio
-                    self.start = (i, j)
-                elif self.maze[i][j] == 4:  # Punto de meta
-                    self.goal = (i, j)
+        self.start = self.maze.find(3)  # Punto de inicio
+        self.goal = self.maze.find(4)  # Punto de meta
 
-    def _backtrack(self, x, y, path):
+    PROGRESS_INTERVAL = 2048  # Pasos de la búsqueda entre cada revisión del presupuesto
+
+    def _backtrack(self):
         
         """
-    This function is the important part of the solver. It uses a recursive backtracking search to find all possible paths in the maze.
+    This function is the important part of the solver. It uses a backtracking search to find all possible paths in the maze.
 
-    This method explores paths recursively from the current position (x, y) to 
-    the goal position. It uses the visited matrix to keep track of visited cells, so it only explores unvisited cells and those cells that are path, shortcut, start or goal. Both conditions
-    are necessary to avoid infinite loops and to avoid other problems. It backtracks
+    This method explores paths from the start position to 
+    the goal position. It uses the visited bitset to keep track of visited nodes, so it only explores nodes that are not
+    already in the current path. This is necessary to avoid infinite loops and to avoid other problems. It backtracks
     when a dead end is reached. Valid paths are added to the list of all paths, and 
     the shortest path is updated if a shorter path is found.
+
+    The search runs over the junction graph instead of the cells: each step walks a whole corridor, so a
+    corridor costs one push and one pop instead of one per cell, and the length of the path is kept as the
+    sum of the corridor lengths. The cells of a path are only rebuilt when it reaches the goal.
+    The search keeps an explicit stack with the edges left to try for every node of the
+    current path, instead of calling itself recursively, so long paths in large mazes do not
+    hit Python's recursion limit. The edges of each node are ordered like the solver directions,
+    so the paths are found in the same order as a recursive search over the cells.
+
+    It is a generator: it yields each path as (path, length) when it is found, and None every
+    PROGRESS_INTERVAL steps so iter_solutions can check its budget. The search never visits a node
+    twice in the same path, so every path is different and no duplicate check is needed.
         """
 
-        if (x, y) == self.goal:
-            # Solo añadir si es una ruta nueva y válida
-            if path not in [p[0] for p in self.all_paths]:
-                self.all_paths.append((list(path), len(path)))
-                
-                if self.shortest_path is None or len(path) < len(self.shortest_path):
+        graph = self.graph
+        adjacency = graph.adjacency
+        goal = graph.goal
+        visited = self.visited = VisitedBitset(graph.node_count)
+        visited.add(graph.start)
+        nodes = [graph.start]
+        steps = []    # (arista, sentido) recorridas desde el inicio
+        lengths = [1] # Celdas del camino hasta cada nodo
+        pending = [iter(graph.adjacency[graph.start])]  # Aristas por probar de cada nodo del camino
+        self._steps = 0
+        while pending:
+            self._steps += 1
+            if self._steps % self.PROGRESS_INTERVAL == 0:
+                yield None
+
+            if nodes[-1] == goal:
+                path = graph.expand(steps)
+                solution = (path, lengths[-1])
+                self.all_paths.append(solution)
+                if self.shortest_path is None or lengths[-1] < len(self.shortest_path):
                     self.shortest_path = list(path)
-            return
+                yield solution
+                self._retreat(nodes, steps, lengths, pending)
+                continue
 
-        # Explorar todas las direcciones posibles
-        for dx, dy in self.directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.rows and 0 <= ny < self.cols: 
-                # Celdas por las que se puede pasar: camino (1), atajo (2), inicio (3) o meta (4)
-                if self.maze[nx][ny] in [1, 2, 3, 4] and not self.visited[nx][ny]:
-                    self.visited[nx][ny] = True
-                    path.append((nx, ny))
-                    self._backtrack(nx, ny, path)
-                    path.pop()
-                    self.visited[nx][ny] = False
\ No newline at end of file
+            # Explorar la siguiente arista posible
+            for neighbor, edge, forward in pending[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    nodes.append(neighbor)
+                    steps.append((edge, forward))
+                    lengths.append(lengths[-1] + graph.weight(edge))
+                    pending.append(iter(adjacency[neighbor]))
+                    break
+            else:
+                self._retreat(nodes, steps, lengths, pending)
+
+    def _retreat(self, nodes, steps, lengths, pending):
+        """
+    Takes one step back in the backtracking search: forgets the edges of the last node and,
+    unless it is the node where the search started, removes it from the path and marks it as not visited.
+        """
+
+        pending.pop()
+        if pending:
+            self.visited.discard(nodes.pop())
+            steps.pop()
+            lengths.pop()
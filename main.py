@@ -7,6 +7,9 @@ from ui.window_game_select import GameSelectWidget
 from ui.window_size import SizeSelectWidget
 from ui.window_maze import MazeWidget
 from config.game_config import GameConfig
+from config.maze_worker import MazeWorker
+from config.maze_pool import MazePool
+from config.background_cache import BackgroundCache
 
 class MainWindow(QStackedWidget):
     def __init__(self):
@@ -18,6 +21,8 @@ Sets the window icon and title.
     - Fixes the window size to 1000x800.
     - Resets the game configuration.
     - Creates intro, game mode, game select, and size select widgets.
+    - Starts filling the pool of pre-generated mazes while the user is in the menus.
+    - Starts loading the backgrounds not used by the menus (the maze one) in the background.
     - Connects the start game signal from the size select widget to create the maze widget.
     - Adds the widgets to the stacked widget and shows the intro screen initially.
         """
@@ -36,6 +41,9 @@ Sets the window icon and title.
         self.game_select_widget = GameSelectWidget(self)
         self.size_select_widget = SizeSelectWidget(self)
         self.maze_widget = None
+        self.maze_pool = MazePool(self)
+        self.maze_pool.fill()
+        BackgroundCache.warm()
 
         
         # Configurar conexión de señales ANTES de añadir widgets
@@ -57,6 +65,7 @@ Sets the window icon and title.
     This method cleans up the maze widget by removing it from the stack (if it exists) and deleting it.
     
     - Checks if the maze widget exists and is a valid widget type.
+    - Cancels its background generation and solving.
     - Removes the widget from the stack and deletes it.
     - Ignores RuntimeError if the widget is already deleted.
     - Resets the maze_widget instance variable to None.
@@ -66,6 +75,7 @@ Sets the window icon and title.
             try:
                 # Verificar si el widget aún existe
                 if self.maze_widget.isWidgetType():
+                    self.maze_widget.cancel_background_work()
                     # Eliminar el widget y quitarlo de la pila
                     self.removeWidget(self.maze_widget)
                     self.maze_widget.deleteLater()
@@ -83,6 +93,7 @@ Sets the window icon and title.
 
     - Cleans up any existing maze widget instance before creating a new one.
     - Ensures that game mode and maze size are configured before proceeding.
+    - Takes a ready maze of the chosen size from the maze pool, if there is one, so the game starts at once.
     - Initializes a new MazeWidget and adds it to the stacked widget.
     - Handles ValueError exceptions by displaying the intro screen.
         """
@@ -95,10 +106,10 @@ Sets the window icon and title.
             # - El modo de juego debe estar establecido
             # - El tamaño del laberinto debe estar establecido
             GameConfig.get_game_mode()
-            GameConfig.get_maze_size()
+            size = GameConfig.get_maze_size()
             
-            # Crear nueva instancia
-            self.maze_widget = MazeWidget(self)
+            # Crear nueva instancia, con un laberinto ya generado si hay uno listo
+            self.maze_widget = MazeWidget(self, maze=self.maze_pool.take(size))
             self.addWidget(self.maze_widget)
             self.setCurrentIndex(4)
             
@@ -140,11 +151,13 @@ def main():
     Entry point of the application.
 
     - Creates a new QApplication instance with the provided command line arguments.
+    - Makes sure background workers are stopped before the application quits.
     - Creates a new MainWindow instance.
     - Shows the main window.
     - Starts the application event loop and waits for it to finish.
     """
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(MazeWorker.shutdown)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,314 @@
+from collections import OrderedDict
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPixmap, QPainter, QImage, QColor, QTransform
+
+
+class MazeLayerItem(QGraphicsItem):
+    TILE_CELLS = 8    # Celdas por lado de cada tile
+    MAX_TILES = 160   # Tiles guardados con celdas de 48 px (unos 90 MB); con otro tamaño se guarda la misma memoria
+
+    # Por debajo de este tamaño de celda en pantalla se dibuja la vista general en vez de los sprites
+    LOD_CELL_PIXELS = 10
+    # Color de cada valor de celda en la vista general: muro, camino, atajo, inicio y meta
+    LOD_COLORS = (0xff2b2b33, 0xffc9b68c, 0xff8b5a2b, 0xff3cb371, 0xffffd700)
+
+    def __init__(self, rows, cols, cell_size, sprites_for, maze=None):
+        """
+        Initializes the static maze layer.
+
+        Instead of adding one QGraphicsPixmapItem per cell, every wall and floor (plus the
+        barrels and chests) is painted into pre-rendered tiles of TILE_CELLS x TILE_CELLS cells,
+        so the scene holds one item for the whole board. A tile is painted the first time it is
+        shown, and paint only draws the tiles that intersect the exposed rect, so the cost of a
+        frame depends on the visible area and not on the size of the maze. The tiles are kept in
+        a least-recently-used cache of MAX_TILES tiles, so a 2001x2001 board (far too big for a
+        single pixmap) only keeps in memory the tiles around the part being looked at.
+        The sprites_for parameter is a function (row, col, size) -> list of QPixmap that returns the
+        sprites to stack on that cell, from bottom to top, already scaled to size x size pixels.
+
+        The tiles are painted at the size a cell has on screen (the zoom level), with sprites that
+        are scaled once per size, so while the zoom of the view makes a cell a whole number of
+        pixels (see MazeView.set_cell_size) the tiles are copied to the screen 1:1, without
+        resampling every sprite on every repaint. When the zoom changes, the tiles of the old
+        level are dropped and painted again at the new size as they are shown.
+
+        If the MazeGrid is given, the layer also has a level of detail for far zooms: when a cell is
+        smaller than LOD_CELL_PIXELS on screen, paint draws an overview instead of the tiles, a QImage
+        of one pixel per cell in Indexed8 format that wraps the bytearray of the grid directly (no copy
+        and no loop per cell), with a color table that gives each cell value its color (LOD_COLORS).
+        Since the image shares the memory of the grid, changes of the cells are seen on the next paint.
+        Below that size every tile would cover only a few pixels, so the overview is both faster and
+        clearer, and it makes a whole 2001x2001 board take milliseconds to show.
+        With TILE_CELLS and MAX_TILES, LOD_CELL_PIXELS keeps the tiles of a full view inside the cache.
+        """
+
+        super().__init__()
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.sprites_for = sprites_for
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+
+        self.tile_size = self.TILE_CELLS * cell_size
+        self.cell_pixels = cell_size  # Tamaño en píxeles de una celda en los tiles guardados
+        self._tiles = OrderedDict()  # (fila del tile, columna del tile) -> QPixmap
+        self._overview = self._build_overview(maze) if maze is not None else None
+
+    def _build_overview(self, maze):
+        """
+        This method returns the Indexed8 QImage that shows the grid with one pixel per cell, built over
+        the bytearray of the grid (each row of cells is one scanline of cols bytes).
+        """
+
+        self._cells = maze.cells  # La imagen usa esta memoria: se mantiene viva con el item
+        image = QImage(self._cells, maze.cols, maze.rows, maze.cols, QImage.Format.Format_Indexed8)
+        image.setColorTable(list(self.LOD_COLORS) + [0xff000000] * (256 - len(self.LOD_COLORS)))
+        return image
+
+    def _set_cell_pixels(self, pixels):
+        """
+        This method changes the size of a cell in the tiles, dropping the tiles of the previous size.
+        """
+
+        if pixels != self.cell_pixels:
+            self.cell_pixels = pixels
+            self._tiles.clear()
+
+    def _max_tiles(self):
+        """
+        This method returns how many tiles fit in the memory of MAX_TILES tiles of cell_size pixels.
+        """
+
+        return max(4, int(self.MAX_TILES * (self.cell_size / self.cell_pixels) ** 2))
+
+    def _tile(self, tile_row, tile_col):
+        """
+        This method returns the pixmap of a tile at the current cell size, painting it if it is not
+        in the cache, and drops the least recently used tile when the cache goes over _max_tiles.
+        """
+
+        key = (tile_row, tile_col)
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+            return pixmap
+
+        tile_pixels = self.TILE_CELLS * self.cell_pixels
+        pixmap = QPixmap(tile_pixels, tile_pixels)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        first_row, first_col = tile_row * self.TILE_CELLS, tile_col * self.TILE_CELLS
+        for row in range(first_row, min(first_row + self.TILE_CELLS, self.rows)):
+            for col in range(first_col, min(first_col + self.TILE_CELLS, self.cols)):
+                self._paint_cell(painter, row, col, first_row, first_col)
+        painter.end()
+
+        self._tiles[key] = pixmap
+        if len(self._tiles) > self._max_tiles():
+            self._tiles.popitem(last=False)
+        return pixmap
+
+    def _paint_cell(self, painter, row, col, first_row, first_col):
+        """
+        This method draws the sprites of one cell at its position inside the tile that begins at
+        (first_row, first_col).
+        """
+
+        size = self.cell_pixels
+        x, y = (col - first_col) * size, (row - first_row) * size
+        for sprite in self.sprites_for(row, col, size):
+            if sprite and not sprite.isNull():
+                painter.drawPixmap(x, y, sprite)
+
+    def update_cell(self, row, col):
+        """
+        This method repaints a single cell of the layer, for example when the start point
+        is moved in Solver mode. If the tile of the cell is cached, the old content of the cell
+        is cleared first so the new sprites are not drawn on top of it; a tile that is not cached
+        is painted with the new sprites when it is shown. Only that cell of the item is invalidated.
+        """
+
+        tile_row, tile_col = row // self.TILE_CELLS, col // self.TILE_CELLS
+        pixmap = self._tiles.get((tile_row, tile_col))
+        if pixmap is not None:
+            first_row, first_col = tile_row * self.TILE_CELLS, tile_col * self.TILE_CELLS
+            painter = QPainter(pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            size = self.cell_pixels
+            painter.fillRect((col - first_col) * size, (row - first_row) * size, size, size, Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            self._paint_cell(painter, row, col, first_row, first_col)
+            painter.end()
+        self.update(QRectF(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size))
+
+    def clear_tiles(self):
+        """
+        This method drops every cached tile, so they are painted again when they are shown.
+        """
+
+        self._tiles.clear()
+        self.update()
+
+    def boundingRect(self):
+        """
+        This method returns the area covered by the whole maze, in scene coordinates.
+        """
+
+        return QRectF(0, 0, self.cols * self.cell_size, self.rows * self.cell_size)
+
+    def paint(self, painter, option, widget=None):
+        """
+        This method draws only the tiles that intersect the exposed rect, so a repaint costs
+        a few blits no matter how many cells the maze has. When the cells are smaller than
+        LOD_CELL_PIXELS on screen, it draws the overview image instead.
+
+        The tiles are painted for the size of a cell on screen, rounded to whole pixels. If the
+        view only scales and moves the scene and that size is exact, the scale is taken out of the
+        painter and the tiles are copied at screen coordinates, pixel by pixel. Otherwise each tile
+        is drawn into its rect of the scene, which only resamples it by less than one pixel per cell.
+        """
+
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+        scale = option.levelOfDetailFromTransform(painter.worldTransform())
+        if self._overview is not None and scale * self.cell_size < self.LOD_CELL_PIXELS:
+            self._paint_overview(painter, exposed)
+            return
+        self._set_cell_pixels(max(1, round(scale * self.cell_size)))
+        size = self.tile_size
+        first_row, last_row = int(exposed.top() // size), int((exposed.bottom() - 1) // size)
+        first_col, last_col = int(exposed.left() // size), int((exposed.right() - 1) // size)
+        tiles = [(tile_row, tile_col) for tile_row in range(first_row, last_row + 1)
+                 for tile_col in range(first_col, last_col + 1)]
+
+        transform = painter.worldTransform()
+        tile_pixels = self.TILE_CELLS * self.cell_pixels
+        if (transform.type().value <= QTransform.TransformationType.TxScale.value and transform.m11() == transform.m22()
+                and abs(transform.m11() * self.cell_size - self.cell_pixels) < 1e-6):
+            # Escala exacta: se dibujan los tiles en coordenadas de pantalla, sin reescalar
+            painter.save()
+            painter.setWorldTransform(QTransform.fromTranslate(round(transform.dx()), round(transform.dy())))
+            for tile_row, tile_col in tiles:
+                painter.drawPixmap(tile_col * tile_pixels, tile_row * tile_pixels, self._tile(tile_row, tile_col))
+            painter.restore()
+            return
+        source = QRectF(0, 0, tile_pixels, tile_pixels)
+        for tile_row, tile_col in tiles:
+            target = QRectF(tile_col * size, tile_row * size, size, size)
+            painter.drawPixmap(target, self._tile(tile_row, tile_col), source)
+
+    def _paint_overview(self, painter, exposed):
+        """
+        This method draws the part of the overview image under the exposed rect, scaled to the maze size,
+        without smoothing so every pixel covers exactly one cell.
+        """
+
+        size = self.cell_size
+        first_row, first_col = int(exposed.top() // size), int(exposed.left() // size)
+        last_row = min(self.rows, int(-(-exposed.bottom() // size)))
+        last_col = min(self.cols, int(-(-exposed.right() // size)))
+        source = QRectF(first_col, first_row, last_col - first_col, last_row - first_row)
+        target = QRectF(first_col * size, first_row * size, source.width() * size, source.height() * size)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.drawImage(target, self._overview, source)
+
+
+class CellOverlayItem(QGraphicsItem):
+    def __init__(self, rows, cols, cell_size):
+        """
+        Initializes the overlay used to highlight cells (solution paths and the backtracking trace).
+
+        Instead of one QGraphicsPixmapItem with a QGraphicsOpacityEffect per highlighted cell, the
+        overlay keeps a small image with one pixel per cell, where the color and alpha of each pixel
+        is the highlight of that cell. The image is drawn scaled by cell_size without smoothing, so
+        showing or clearing a path of any length costs a single repaint of one item.
+        """
+
+        super().__init__()
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+        self._mask = QImage(cols, rows, QImage.Format.Format_ARGB32_Premultiplied)
+        self._mask.fill(Qt.GlobalColor.transparent)
+
+    @staticmethod
+    def _with_alpha(color, opacity):
+        """
+        This method returns a QColor of the given color with the given opacity (0 to 1).
+        """
+
+        color = QColor(color)
+        color.setAlphaF(opacity)
+        return color
+
+    def set_cell(self, row, col, color, opacity=1.0):
+        """
+        This method highlights one cell with the given color and opacity, and repaints only that cell.
+        """
+
+        self._mask.setPixelColor(col, row, self._with_alpha(color, opacity))
+        self.update(QRectF(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size))
+
+    def set_cells(self, cells, color, opacity=1.0):
+        """
+        This method highlights a list of (row, col) cells with the same color and opacity,
+        and repaints the overlay once.
+        """
+
+        color = self._with_alpha(color, opacity)
+        for row, col in cells:
+            self._mask.setPixelColor(col, row, color)
+        self.update()
+
+    def clear_cells(self, cells):
+        """
+        This method removes the highlight of a list of (row, col) cells, and repaints only the area
+        they cover, so clearing a short path does not depend on the size of the maze.
+        """
+
+        if not cells:
+            return
+        transparent = QColor(Qt.GlobalColor.transparent)
+        for row, col in cells:
+            self._mask.setPixelColor(col, row, transparent)
+        rows = [row for row, _ in cells]
+        cols = [col for _, col in cells]
+        size = self.cell_size
+        self.update(QRectF(min(cols) * size, min(rows) * size,
+                           (max(cols) - min(cols) + 1) * size, (max(rows) - min(rows) + 1) * size))
+
+    def clear(self):
+        """
+        This method removes every highlight of the overlay.
+        """
+
+        self._mask.fill(Qt.GlobalColor.transparent)
+        self.update()
+
+    def boundingRect(self):
+        """
+        This method returns the area covered by the whole maze, in scene coordinates.
+        """
+
+        return QRectF(0, 0, self.cols * self.cell_size, self.rows * self.cell_size)
+
+    def paint(self, painter, option, widget=None):
+        """
+        This method draws the part of the cell mask under the exposed rect, scaled to the maze size.
+        Smoothing is disabled so every pixel of the mask covers exactly one cell.
+        """
+
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+        size = self.cell_size
+        first_row, first_col = int(exposed.top() // size), int(exposed.left() // size)
+        last_row = min(self.rows, int(-(-exposed.bottom() // size)))
+        last_col = min(self.cols, int(-(-exposed.right() // size)))
+        source = QRectF(first_col, first_row, last_col - first_col, last_row - first_row)
+        target = QRectF(first_col * size, first_row * size, source.width() * size, source.height() * size)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.drawImage(target, self._mask, source)
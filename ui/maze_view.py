@@ -0,0 +1,160 @@
+import math
+from PyQt6.QtWidgets import QGraphicsView
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QTransform
+
+
+class MazeView(QGraphicsView):
+    ZOOM_STEP = 1.25   # Factor de zoom de cada paso de la rueda
+    MAX_SCALE = 2.0    # Zoom máximo: una celda de 48 px se ve a 96 px
+
+    # Se emite cuando cambia la parte visible de la escena (zoom, desplazamiento o tamaño)
+    view_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        """
+        Initializes the view of the maze, with zoom and pan.
+
+        The mouse wheel zooms in and out around the cursor, between min_scale (set by the maze widget,
+        see set_scale_limits) and MAX_SCALE, and dragging with the right or middle button pans the board.
+        The left button is left to the maze widget, which uses it to choose the start point. The scroll
+        bars are hidden but still move the visible part of the scene. Every change of the visible part
+        emits view_changed, for example to keep a minimap up to date.
+
+        If the size of a cell is given with set_cell_size, the zoom only takes the values at which a cell
+        is a whole number of pixels on screen, so the maze layer can copy its tiles without resampling them.
+        """
+
+        super().__init__(parent)
+        self.min_scale = 1.0
+        self.max_scale = self.MAX_SCALE
+        self.cell_size = None
+        self._pan_start = None
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
+
+    @property
+    def scale_factor(self):
+        return self.transform().m11()
+
+    def set_cell_size(self, cell_size):
+        """
+        This method makes the zoom snap to whole pixels per cell of cell_size scene units, or stops it with None.
+        """
+
+        self.cell_size = cell_size
+
+    def _snap(self, scale):
+        """
+        This method returns the scale nearest to the given one (inside the scale limits) at which a cell is
+        a whole number of pixels. Below one pixel per cell, or if there is no such scale inside the limits,
+        the scale is returned as it is.
+        """
+
+        if self.cell_size is None or scale * self.cell_size < 1:
+            return scale
+        pixels = round(scale * self.cell_size)
+        if pixels < self.min_scale * self.cell_size:
+            pixels = math.ceil(self.min_scale * self.cell_size)
+        if pixels > self.max_scale * self.cell_size:
+            pixels = math.floor(self.max_scale * self.cell_size)
+        snapped = pixels / self.cell_size
+        return snapped if self.min_scale <= snapped <= self.max_scale else scale
+
+    def set_scale_limits(self, min_scale, max_scale=None):
+        """
+        This method sets the range of the zoom, and brings the current zoom inside it.
+        When the zoom snaps to whole pixels, the smallest zoom is rounded down to one of them.
+        """
+
+        if self.cell_size is not None and min_scale * self.cell_size >= 1:
+            min_scale = math.floor(min_scale * self.cell_size) / self.cell_size
+        self.min_scale = min_scale
+        self.max_scale = max(min_scale, max_scale if max_scale is not None else self.MAX_SCALE)
+        self.set_scale(self.scale_factor)
+
+    def set_scale(self, scale):
+        """
+        This method sets the zoom of the view, clamped to the scale limits.
+        """
+
+        scale = self._snap(min(max(scale, self.min_scale), self.max_scale))
+        self.setTransform(QTransform.fromScale(scale, scale))
+        self.view_changed.emit()
+
+    def visible_scene_rect(self):
+        """
+        This method returns the part of the scene shown in the viewport, as a QRectF.
+        """
+
+        return self.mapToScene(self.viewport().rect()).boundingRect().intersected(self.sceneRect())
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.view_changed.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.view_changed.emit()
+
+    def zoom(self, factor):
+        """
+        This method multiplies the zoom of the view by factor, keeping it inside the scale limits.
+        If the zoom snaps to whole pixels and the step is too small to reach the next one, a cell grows
+        or shrinks by one pixel instead.
+        """
+
+        current = self.scale_factor
+        scale = self._snap(min(max(current * factor, self.min_scale), self.max_scale))
+        if scale == current and factor != 1 and self.cell_size is not None and current * self.cell_size >= 1:
+            scale = self._snap((round(current * self.cell_size) + (1 if factor > 1 else -1)) / self.cell_size)
+        self.set_scale(scale)
+
+    def wheelEvent(self, event):
+        """
+        This method zooms in or out one ZOOM_STEP for each step of the mouse wheel.
+        """
+
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self.zoom(self.ZOOM_STEP ** steps)
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """
+        This method starts a pan with the right or middle button. Other buttons are handled as usual.
+        """
+
+        if event.button() in (Qt.MouseButton.RightButton, Qt.MouseButton.MiddleButton):
+            self._pan_start = event.position().toPoint()
+            self.viewport().setCursor(Qt.CursorShape.ClosedHandCursor)
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """
+        This method moves the visible part of the board while a pan is in progress.
+        """
+
+        if self._pan_start is not None:
+            position = event.position().toPoint()
+            delta = position - self._pan_start
+            self._pan_start = position
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
+            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """
+        This method ends the pan when its button is released.
+        """
+
+        if self._pan_start is not None and event.button() in (Qt.MouseButton.RightButton, Qt.MouseButton.MiddleButton):
+            self._pan_start = None
+            self.viewport().unsetCursor()
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
@@ -0,0 +1,170 @@
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QPolygonF
+from ui.maze_layer import MazeLayerItem
+
+
+class MinimapWidget(QWidget):
+    MAX_SIZE = 180        # Lado máximo del minimapa, en píxeles
+    DOT_RADIUS = 3
+    PLAYER_COLOR = Qt.GlobalColor.red
+    START_COLOR = Qt.GlobalColor.green
+    VIEW_COLOR = Qt.GlobalColor.white
+
+    # Se emite con la celda (fila, columna) en la que se hizo clic
+    cell_clicked = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        """
+        Initializes the minimap, a small view of the whole maze drawn in a corner of the game area.
+
+        The grid is rendered once into a cached pixmap, scaled from a one pixel per cell image of the maze
+        with the same colors as the overview of the maze layer (see set_maze). On top of it, each frame only
+        draws the markers that move: the player and start dots, the polyline of the solution being shown and
+        the outline of the part of the maze visible in the main view. Moving the player repaints only the
+        area of its old and new dot, so the cost of the minimap does not grow with the size of the maze.
+        Clicking on it emits cell_clicked with the cell under the mouse.
+        """
+
+        super().__init__(parent)
+        self.rows = self.cols = 0
+        self.scale = 1.0
+        self._background = None
+        self._player = None
+        self._start = None
+        self._solution = None
+        self._solution_color = None
+        self._view_rect = None
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+    def set_maze(self, maze):
+        """
+        This method renders the grid of the maze into the cached pixmap and resizes the minimap to it.
+        The start is drawn as a dot (see set_start), so its cell gets the color of a path in the pixmap.
+        """
+
+        self.rows, self.cols = maze.rows, maze.cols
+        self.scale = self.MAX_SIZE / max(self.rows, self.cols)
+        colors = list(MazeLayerItem.LOD_COLORS)
+        colors[3] = colors[1]  # El inicio se dibuja aparte y puede moverse
+        image = QImage(maze.cells, self.cols, self.rows, self.cols, QImage.Format.Format_Indexed8)
+        image.setColorTable(colors + [0xff000000] * (256 - len(colors)))
+        width, height = max(1, round(self.cols * self.scale)), max(1, round(self.rows * self.scale))
+        mode = Qt.TransformationMode.SmoothTransformation if self.scale < 1 else Qt.TransformationMode.FastTransformation
+        self._background = QPixmap.fromImage(image.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio, mode))
+        self._player = self._start = self._solution = self._view_rect = None
+        self.setFixedSize(width, height)
+        self.update()
+
+    def _cell_point(self, row, col):
+        """
+        Returns the point of the minimap at the center of the cell (row, col).
+        """
+
+        return QPointF((col + 0.5) * self.scale, (row + 0.5) * self.scale)
+
+    def _dot_rect(self, cell):
+        """
+        Returns the area of the minimap covered by the dot of a cell, with a margin of one pixel.
+        """
+
+        point = self._cell_point(*cell)
+        r = self.DOT_RADIUS + 1
+        return QRectF(point.x() - r, point.y() - r, 2 * r, 2 * r).toAlignedRect()
+
+    def _move_dot(self, old, new):
+        """
+        This method repaints only the areas of the old and new position of a dot.
+        """
+
+        if old == new:
+            return
+        if old is not None:
+            self.update(self._dot_rect(old))
+        if new is not None:
+            self.update(self._dot_rect(new))
+
+    def set_player(self, cell):
+        """
+        This method moves the player dot to the given (row, col) cell, or hides it with None.
+        """
+
+        old, self._player = self._player, cell
+        self._move_dot(old, cell)
+
+    def set_start(self, cell):
+        """
+        This method moves the start dot to the given (row, col) cell, or hides it with None.
+        """
+
+        old, self._start = self._start, cell
+        self._move_dot(old, cell)
+
+    def set_solution(self, path, color=None):
+        """
+        This method sets the solution polyline from a list of (row, col) cells, or removes it with None.
+        Consecutive cells that fall on the same pixel of the minimap are merged, so the polyline of a long
+        path has at most a point per pixel it crosses.
+        """
+
+        self._solution = None
+        if path:
+            points = QPolygonF()
+            last = None
+            for row, col in path:
+                point = self._cell_point(row, col)
+                pixel = (int(point.x()), int(point.y()))
+                if pixel != last:
+                    points.append(point)
+                    last = pixel
+            self._solution = points
+            self._solution_color = QColor(color if color is not None else Qt.GlobalColor.green)
+        self.update()
+
+    def set_view_rect(self, rect):
+        """
+        This method sets the part of the maze visible in the main view, as a QRectF in cells.
+        """
+
+        self._view_rect = QRectF(rect.x() * self.scale, rect.y() * self.scale,
+                                 rect.width() * self.scale, rect.height() * self.scale)
+        self.update()
+
+    def paintEvent(self, event):
+        """
+        This method draws the cached pixmap of the maze and the markers on top of it.
+        """
+
+        if self._background is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(event.rect(), self._background, event.rect())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        if self._solution is not None:
+            painter.setPen(QPen(self._solution_color, 1.5))
+            painter.drawPolyline(self._solution)
+        if self._view_rect is not None:
+            painter.setPen(QPen(QColor(self.VIEW_COLOR), 1))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(self._view_rect.intersected(QRectF(self.rect().adjusted(0, 0, -1, -1))))
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for cell, color in ((self._start, self.START_COLOR), (self._player, self.PLAYER_COLOR)):
+            if cell is not None:
+                painter.setBrush(QColor(color))
+                painter.drawEllipse(self._cell_point(*cell), self.DOT_RADIUS, self.DOT_RADIUS)
+        painter.end()
+
+    def mousePressEvent(self, event):
+        """
+        This method emits cell_clicked with the cell under the mouse.
+        """
+
+        if self._background is None:
+            return
+        position = event.position()
+        row = min(self.rows - 1, max(0, int(position.y() / self.scale)))
+        col = min(self.cols - 1, max(0, int(position.x() / self.scale)))
+        self.cell_clicked.emit(row, col)
+        event.accept()
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QPalette, QBrush
 from config.atlas_loader import AtlasLoader
+from config.background_cache import BackgroundCache
 from config.game_config import GameConfig
 
 class GameModeWidget(QWidget):
@@ -83,15 +84,10 @@ class GameModeWidget(QWidget):
 
         self.background = QLabel(self)
         try:
-            pixmap = QPixmap("assets/bg_game_mode.png")
-            if pixmap.isNull():
+            # Decodificada y escalada una sola vez, compartida con las demás pantallas
+            pixmap = BackgroundCache.get("bg_game_mode.png")
+            if pixmap is None:
                 raise FileNotFoundError
-            # Escalar la imagen al tamaño de la ventana
-            pixmap = pixmap.scaled(
-                1000, 800, 
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
             self.background.setPixmap(pixmap)
             self.background.setGeometry(0, 0, 1000, 800)
             self.background.lower()  # Enviar al fondo
@@ -116,15 +112,12 @@ class GameModeWidget(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setSpacing(10)
         
-        # Cargar imagen del atlas
-        pixmap = self.atlas_loader.get_frame(atlas_name, frame_name)
-        if pixmap and not pixmap.isNull():
+        # Escalado una sola vez y guardado en la caché del AtlasLoader
+        scaled_pixmap = self.atlas_loader.get_scaled_frame(
+            atlas_name, frame_name, 100, 100, Qt.AspectRatioMode.KeepAspectRatio
+        )
+        if scaled_pixmap and not scaled_pixmap.isNull():
             image_label = QLabel(button)
-            scaled_pixmap = pixmap.scaled(
-                100, 100, 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             image_label.setPixmap(scaled_pixmap)
             image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(image_label)
@@ -164,14 +157,9 @@ class GameModeWidget(QWidget):
         layout.setSpacing(10)
         
         # Cargar imagen del libro
-        book_pixmap = QPixmap("assets/book.png")
-        if not book_pixmap.isNull():
+        scaled_pixmap = self.atlas_loader.get_scaled_image("book.png", 100, 100)
+        if scaled_pixmap and not scaled_pixmap.isNull():
             image_label = QLabel(button)
-            scaled_pixmap = book_pixmap.scaled(
-                100, 100, 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             image_label.setPixmap(scaled_pixmap)
             image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(image_label)
@@ -16,6 +16,8 @@ from PyQt6.QtWidgets import QFileDialog
 import os
 import json
 from config.game_config import GameConfig
+from config.atlas_loader import AtlasLoader
+from config.background_cache import BackgroundCache
 from PyQt6.QtWidgets import QFileDialog
 
 class GameSelectWidget(QWidget):
@@ -27,6 +29,7 @@ It sets the parent window and calls the method to set up the user interface comp
 
         super().__init__(parent)
         self.parent_window = parent
+        self.atlas_loader = AtlasLoader()
         self._setup_ui()
      
     def _setup_ui(self):
@@ -92,15 +95,10 @@ It sets the parent window and calls the method to set up the user interface comp
 
         self.background = QLabel(self)
         try:
-            pixmap = QPixmap("assets/bg_game_mode.png")
-            if pixmap.isNull():
+            # Decodificada y escalada una sola vez, compartida con las demás pantallas
+            pixmap = BackgroundCache.get("bg_game_mode.png")
+            if pixmap is None:
                 raise FileNotFoundError
-            # Escalar la imagen al tamaño de la ventana
-            pixmap = pixmap.scaled(
-                1000, 800, 
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
             self.background.setPixmap(pixmap)
             self.background.setGeometry(0, 0, 1000, 800)
             self.background.lower()  # Enviar al fondo
@@ -126,15 +124,10 @@ It sets the parent window and calls the method to set up the user interface comp
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setSpacing(10)
         
-        # Cargar imagen
-        pixmap = QPixmap(f"assets/{image_path}")
-        if not pixmap.isNull():
+        # Escalada una sola vez y guardada en la caché del AtlasLoader
+        scaled_pixmap = self.atlas_loader.get_scaled_image(image_path, 100, 100)
+        if scaled_pixmap and not scaled_pixmap.isNull():
             image_label = QLabel(button)
-            scaled_pixmap = pixmap.scaled(
-                100, 100, 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             image_label.setPixmap(scaled_pixmap)
             image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(image_label)
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QPalette, QBrush
+from config.background_cache import BackgroundCache
 
 class IntroWidget(QWidget):
     def __init__(self, parent=None):
@@ -35,13 +36,13 @@ class IntroWidget(QWidget):
         """
         This method sets up the background for the intro screen (the first screen you see when you start the game).
           Searching the image in the assets folder and loading the image intro.png and scaling it to fit the window size.
+          The scaled image is taken from the BackgroundCache, so it is decoded only once.
         """
         try:
-            pixmap = QPixmap("assets/bg_intro.png")
-            if pixmap.isNull():
+            pixmap = BackgroundCache.get("bg_intro.png")
+            if pixmap is None:
                 raise FileNotFoundError
             self.background = QLabel(self)
-            pixmap = pixmap.scaled(1000, 800, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
             self.background.setPixmap(pixmap)
             self.background.setGeometry(0, 0, 1000, 800)
             self.background.lower()
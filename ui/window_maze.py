@@ -1,15 +1,22 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGraphicsOpacityEffect,
-    QFrame, QLabel, QPushButton, QGraphicsView, QApplication,
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QFrame, QLabel, QPushButton, QApplication,
     QGraphicsScene, QGraphicsPixmapItem, QMessageBox
 )
 
 from PyQt6.QtCore import *
-from PyQt6.QtGui import QPixmap, QPalette, QTransform, QPainter, QKeyEvent
+from PyQt6.QtGui import QPixmap, QPalette, QPainter, QKeyEvent
 from config.game_config import GameConfig
 from config.Generate import MazeGenerator
 from config.atlas_loader import AtlasLoader
+from config.background_cache import BackgroundCache
 from config.solve import MazeSolver
+from config.maze_grid import MazeGrid
+from config.maze_worker import MazeWorker
+from config.distance_field import DistanceField
+from ui.maze_layer import MazeLayerItem, CellOverlayItem
+from ui.maze_view import MazeView
+from ui.minimap import MinimapWidget
 import os
 import json
 from datetime import datetime
@@ -17,13 +24,34 @@ import random
 
 
 class MazeWidget(QWidget):
-    def __init__(self, parent=None, loaded_maze=None):
+    # Límites de la enumeración de soluciones (ver _pull_solutions)
+    FIRST_SOLUTIONS_LIMIT = 5000
+    FIRST_SOLUTIONS_BUDGET = 2.0
+    NEXT_SOLUTIONS_LIMIT = 500
+    NEXT_SOLUTIONS_BUDGET = 0.1
+
+    # Velocidad de la animación del backtracking (ver set_animation_speed)
+    ANIMATION_INTERVAL = 100
+    MIN_ANIMATION_INTERVAL = 10
+    MAX_ANIMATION_INTERVAL = 1000
+    MAX_ANIMATION_STEPS = 4096
+
+    # Por debajo de este tamaño de celda en pantalla se muestra el minimapa y la vista sigue al jugador
+    FOLLOW_CELL_PIXELS = 24
+    MINIMAP_MARGIN = 10
+
+    # Pista del modo Classic (ver show_hint)
+    HINT_LENGTH = 5
+    HINT_COLOR = Qt.GlobalColor.yellow
+
+    def __init__(self, parent=None, loaded_maze=None, maze=None):
         """
         Initializes the MazeWidget with the given parent and loaded maze.
-        If the loaded_maze parameter is None, a new maze is generated and rendered.
-        If the loaded_maze parameter is not None, the given maze is rendered.
-        Depending on the game mode, the player is set up or not.
-        The window is set to accept keyboard focus.
+        If the loaded_maze parameter is None, a new maze is generated in a background
+        worker and rendered when it is ready, unless an already generated maze (a MazeGrid,
+        for example from the MazePool) is given in the maze parameter; then it is rendered at once.
+        If the loaded_maze parameter is not None, the given maze is rendered. Depending on the game mode, the player is set up or not
+        once the maze is rendered. The window is set to accept keyboard focus.
         """
         
         super().__init__(parent)
@@ -31,14 +59,15 @@ class MazeWidget(QWidget):
         self._setup_timers()
         self._setup_ui()
         
-        if self.loaded_maze == None:
+        if self.loaded_maze == None and maze is not None:
+            self._on_maze_generated(maze)
+        elif self.loaded_maze == None:
             self._generate_and_render_maze()
         else:
             self.create_and_render_maze()
 
         
         if self.game_mode == 'Classic':
-            self._setup_player()
             self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
 
@@ -64,13 +93,36 @@ class MazeWidget(QWidget):
         self.maze_size = GameConfig.get_maze_size()
 
         self.atlas_loader = AtlasLoader()
+        self.maze = None
+        self.rng = random.Random()  # Azar del widget (punto de inicio), con la semilla del laberinto
+        self.rows = 0
+        self.cols = 0
+        self.player = None
+        self.player_item = None
+        self.generation_worker = None
+        self.solve_worker = None
+        self.solving = False
         self.cell_size = 48
         self.scale_factor = 1.0
+        self.minimap_enabled = False
+        self.render_mode = "composited"  # "composited" (una sola capa) o "cells" (un item por celda)
+        self.maze_layer = None
+        self.start_item = None
         self.solutions = []
+        self.solver = None
+        self.seen_solutions = set()
+        self.shortest_solution = None
         self.current_solution_index = -1
-        self.solution_items = []
+        self.solution_overlay = None
         self.is_showing_solution = False
+        self.showing_hint = False
+        self.hint_cells = []
         self.showing_backtracking_animation = False
+        self.animation_paused = False
+        self.animation_interval = self.ANIMATION_INTERVAL
+        self.animation_steps_per_tick = 1
+        self.animation_solver = None
+        self.backtracking_steps = None
         self.should_stop_animating = False
         self.is_moving = False
         self.animation_frame_index = 0
@@ -85,18 +137,22 @@ class MazeWidget(QWidget):
     def _setup_timers(self):
         
         """
-        This method creates two timers: one for updating the animation frame
-        and another for stopping the animation after a certain time.
+        This method creates three timers: one for updating the animation frame,
+        another for stopping the animation after a certain time, and one that
+        drives the backtracking animation of the solver.
 
-        The animation timer is connected to the _update_animation_frame 
-        and the stop animation timer is connected to the _complete_animation_cycle .
+        The animation timer is connected to the _update_animation_frame,
+        the stop animation timer is connected to the _complete_animation_cycle
+        and the backtracking timer is connected to _advance_backtracking_animation.
 
-        The timeouts are set to 100ms and 500ms respectively.
+        The timeouts are set when the timers are started.
         """
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self._update_animation_frame)
         self.stop_animation_timer = QTimer()
         self.stop_animation_timer.timeout.connect(self._complete_animation_cycle)
+        self.backtracking_timer = QTimer(self)
+        self.backtracking_timer.timeout.connect(self._advance_backtracking_animation)
 
     # ==================== UI SETUP METHODS ====================
     def _setup_ui(self):
@@ -127,17 +183,21 @@ class MazeWidget(QWidget):
         """
         This method sets up the game area widget. It creates a frame
         with a translucent background and adds a graphics view to it.
-        The graphics view is configured to render the graphics
-        antialiased and to ignore the horizontal and vertical scroll
-        bars. The graphics view is then added to a horizontal layout
-        in the game area frame, which is centered.
+        The graphics view is a MazeView, which zooms with the mouse wheel
+        and pans by dragging with the right or middle button. It is configured
+        to render the graphics antialiased and to hide the horizontal and
+        vertical scroll bars. The graphics view is then added to a horizontal layout
+        in the game area frame, which is centered. A MinimapWidget is placed over
+        the top right corner of the game area; it is only shown for mazes too big to be read
+        at once (see _adjust_view), and clicking on it centers the view on that cell.
 
         """
 
         self.game_area = QFrame(self)
         self.game_area.setStyleSheet("background-color: rgba(0, 0, 0, 0.3);")
         
-        self.graphics_view = QGraphicsView(self.game_area)
+        self.graphics_view = MazeView(self.game_area)
+        self.graphics_view.set_cell_size(self.cell_size)
         self.scene = QGraphicsScene()
         self.graphics_view.setScene(self.scene)
         self.graphics_view.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -150,6 +210,11 @@ class MazeWidget(QWidget):
         game_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         game_layout.addWidget(self.graphics_view)
 
+        self.minimap = MinimapWidget(self.game_area)
+        self.minimap.hide()
+        self.minimap.cell_clicked.connect(self._center_view_on)
+        self.graphics_view.view_changed.connect(self._update_minimap_view)
+
     def _setup_bottom_panel(self):
         
         """
@@ -168,8 +233,11 @@ class MazeWidget(QWidget):
         * Next Solver
         * Save Map
         * Reset Start (only for game mode 'Solver')
+        * Hint (only for game mode 'Classic')
         * Back to Menu
 
+        After the buttons, a status label shows the progress of the background generation and solving.
+
         The buttons are centered horizontally in the bottom panel and are evenly spaced. The bottom panel
         is then added to the main layout of the window at the bottom, with no spacing or margins.
         """
@@ -189,9 +257,18 @@ class MazeWidget(QWidget):
         # Botón específico para modo Solver
         if self.game_mode == 'Solver':
             self._create_button("Reset Start", self.remove_start, layout)
+
+        # Botón específico para modo Classic
+        if self.game_mode == 'Classic':
+            self._create_button("Hint (H)", self.show_hint, layout)
             
         self._create_button("Back to Menu", self._go_back, layout)
 
+        self.status_label = QLabel("", self.bottom_panel)
+        self.status_label.setFixedWidth(170)
+        self.status_label.setStyleSheet("font-size: 14px; color: white; background: transparent;")
+        layout.addWidget(self.status_label)
+
 
     def _create_button(self, text, callback, layout):
         
@@ -228,17 +305,40 @@ class MazeWidget(QWidget):
     def _generate_and_render_maze(self):
         
         """
-        This function generates a new maze using MazeGenerator and renders it on the QGraphicsScene.
+        This function generates a new maze using MazeGenerator in a MazeWorker, so the window
+        stays responsive while the maze is carved. When the maze is ready, _on_maze_generated renders it.
+        A new seed is drawn for every maze; it is recorded in the maze and in its save file, so the same board
+        can be generated again.
+        """
 
-        If the game mode is Classic, it sets a random start point and calculates all possible solutions.
+        self._set_status("Generating maze...")
+        seed = random.randrange(2 ** 32)
+        # La configuración se lee aquí y no en el worker, que puede terminar después de un reset
+        size, algorithm = GameConfig.get_maze_size(), GameConfig.get_generation_algorithm()
+        settings = MazeGenerator.generation_settings()
+        self.generation_worker = MazeWorker(
+            lambda worker: MazeGenerator.generate_maze(size, algorithm, seed=seed, settings=settings))
+        self.generation_worker.result_ready.connect(self._on_maze_generated)
+        self.generation_worker.failed.connect(self._on_worker_failed)
+        self.generation_worker.start()
+
+    def _on_maze_generated(self, maze):
+        
+        """
+        This function receives the maze generated by the worker and renders it on the QGraphicsScene.
+
+        If the game mode is Classic, it sets a random start point and starts calculating the solutions.
         Then it clears the scene and renders each cell of the maze.
-        If a start point is set, it renders the start point.
+        If a start point is set, it renders the start point, and the player in Classic mode.
         Finally, it adjusts the view to fit the maze.
         """
 
-        self.maze = MazeGenerator.generate_maze()
-        self.rows = len(self.maze)
-        self.cols = len(self.maze[0]) if self.rows > 0 else 0
+        self.generation_worker = None
+        self._set_status("")
+        self.maze = maze
+        self.rng = random.Random(maze.seed)
+        self.rows = self.maze.rows
+        self.cols = self.maze.cols
         self.maze_width = self.cols * self.cell_size
         self.maze_height = self.rows * self.cell_size
         
@@ -246,14 +346,9 @@ class MazeWidget(QWidget):
             self._set_random_start_point()
             self._calculate_solutions()
         
-        self.scene.clear()
-        
-        for row in range(self.rows):
-            for col in range(self.cols):
-                self._render_cell(row, col)
-        
-        if self.start_point:
-            self._render_start_point()
+        self._render_maze()
+        if self.game_mode == 'Classic':
+            self._setup_player()
         
         QTimer.singleShot(100, self._adjust_view)
     
@@ -263,81 +358,124 @@ class MazeWidget(QWidget):
         This method renders the maze that was loaded from a file.
 
         Sets the maze attributes from the loaded maze and clears the scene.
+        The "map" of the save file (a list of lists) is converted to a MazeGrid, and the seed and algorithm
+        are restored when the save file has them.
         If the game mode is Classic, it sets a random start point and calculates all possible solutions.
         Then it renders each cell of the maze.
         If the game mode is solver, it sets the start point from the loaded maze data and renders it.
         Finally, it adjusts the view to fit the maze.
         """
 
-        self.maze = self.loaded_maze['map']
+        self.maze = MazeGrid.from_list(self.loaded_maze['map'])
+        self.maze.seed = self.loaded_maze.get('seed')
+        self.maze.algorithm = self.loaded_maze.get('algorithm')
+        self.rng = random.Random(self.maze.seed)
         self.rows = self.loaded_maze['rows']
         self.cols = self.loaded_maze['cols']
         self.maze_width = self.cols * self.cell_size
         self.maze_height = self.rows * self.cell_size
 
         if self.game_mode == 'Classic':
-            # Buscar la posición donde está el número 4 en self.maze
-            for i in range(len(self.maze)):
-                for j in range(len(self.maze[i])):
-                    if self.maze[i][j] == 3:
-                        self.maze[i][j] = 1  
-                        break 
-           
-            self.start_point = (random.randint(1, len(self.maze) - 2), random.randint(1, len(self.maze[0]) - 2))
-            self.maze[self.start_point[0]][self.start_point[1]] = 3  # Colocar el 4 en la nueva posición
+            # Quita el inicio guardado y coloca uno nuevo que pueda llegar a la meta
+            self._set_random_start_point()
             self._calculate_solutions()
             self.selecting_start_point = False
-            self._render_start_point()
-
-
-        self.scene.clear()
-        for row in range(self.rows):
-            for col in range(self.cols):
-                self._render_cell(row, col)
-        
 
         if self.game_mode == 'Solver':
             self.start_point = self.loaded_maze['start_point']
-            self._render_start_point()
             self.selecting_start_point = False
             self._calculate_solutions()
 
+        self._render_maze()
+        if self.game_mode == 'Classic':
+            self._setup_player()
+
         QTimer.singleShot(100, self._adjust_view)
 
-    def _render_cell(self, row, col):
+    def _render_maze(self):
         
         """
-        This method first checks if the cell value is in the sprites dictionary.
-        If it is, it renders the corresponding sprite. If the sprite information
-        is a tuple, it renders the floor first if necessary, and then renders the
-        detail sprite. Otherwise, it renders the sprite directly.
+        This method clears the scene and renders the static part of the maze (walls, floors,
+        barrels and the chest), then the start point on top of it.
 
+        In the "composited" render mode (the default) the whole board is painted once into a
+        single MazeLayerItem, so the scene does not grow with the maze size. In the "cells"
+        render mode every cell is added as its own QGraphicsPixmapItem, as it was done before.
+        Only the dynamic overlays (player, start marker, solutions) are separate items. Solution paths
+        and the backtracking trace share one CellOverlayItem, drawn above the maze and the start point.
         """
-        cell_value = self.maze[row][col]
-        sprites = {
-            MazeGenerator.WALL: self._get_wall_sprite(row, col),
-            MazeGenerator.PATH: self._get_floor_sprite(row, col),
-            MazeGenerator.SHORTCUT: ("barrel", True),
-            MazeGenerator.GOAL: ("chest1", True),
-            MazeGenerator.START: ("stairs", True)
-        }
+
+        self.scene.clear()
+        self.maze_layer = None
+        self.start_item = None
+        self.is_showing_solution = False
+
+        if self.render_mode == "composited":
+            self.maze_layer = MazeLayerItem(self.rows, self.cols, self.cell_size, self._get_cell_sprites, self.maze)
+            self.scene.addItem(self.maze_layer)
+        else:
+            for row in range(self.rows):
+                for col in range(self.cols):
+                    self._render_cell(row, col)
+
+        self.solution_overlay = CellOverlayItem(self.rows, self.cols, self.cell_size)
+        self.solution_overlay.setZValue(1)
+        self.scene.addItem(self.solution_overlay)
+        self.minimap.set_maze(self.maze)
+
+        if self.start_point:
+            self._render_start_point()
+
+    def _render_cell(self, row, col):
         
-        if cell_value not in sprites:
+        """
+        This method renders (or re-renders) a single cell of the maze.
+        In the composited render mode it repaints that cell inside the maze layer,
+        otherwise it adds the sprites of the cell to the scene as new items.
+        """
+
+        if self.maze_layer is not None:
+            self.maze_layer.update_cell(row, col)
             return
-            
-        sprite_info = sprites[cell_value]
+
+        for sprite in self._get_cell_sprites(row, col):
+            if sprite and not sprite.isNull():
+                self._add_sprite_to_scene(sprite, row, col)
+
+    def _get_cell_sprites(self, row, col, size=None):
         
-        # Renderizar piso primero si es necesario
-        if isinstance(sprite_info, tuple) and sprite_info[1]:
-            floor_sprite = self._get_floor_sprite(row, col)
-            if floor_sprite and not floor_sprite.isNull():
-                self._add_sprite_to_scene(floor_sprite, row, col)
-            
-            detail_sprite = self.atlas_loader.get_frame("details", sprite_info[0])
-            if detail_sprite and not detail_sprite.isNull():
-                self._add_sprite_to_scene(detail_sprite, row, col)
-        elif sprite_info and not sprite_info.isNull():
-            self._add_sprite_to_scene(sprite_info, row, col)
+        """
+        This method returns the list of sprites that must be drawn on a cell, from bottom to top.
+        Walls and paths use a single sprite. Shortcuts and the goal draw the floor first and then
+        the detail sprite (barrel or chest). The start cell only draws the floor, because the
+        stairs are a separate item that moves with the start point (see _render_start_point).
+        If size is given, the sprites are scaled to size x size pixels (see _get_sprite).
+        """
+
+        cell_value = self.maze.get(row, col)
+        if cell_value == MazeGenerator.WALL:
+            return [self._get_wall_sprite(row, col, size)]
+        if cell_value in (MazeGenerator.PATH, MazeGenerator.START):
+            return [self._get_floor_sprite(row, col, size)]
+
+        details = {
+            MazeGenerator.SHORTCUT: "barrel",
+            MazeGenerator.GOAL: "chest1"
+        }
+        if cell_value not in details:
+            return []
+        return [self._get_floor_sprite(row, col, size), self._get_sprite("details", details[cell_value], size)]
+
+    def _get_sprite(self, atlas_name, frame_name, size=None):
+        
+        """
+        This method returns a frame of the atlas, or the frame scaled to size x size pixels if size is given.
+        The scaled frames are cached by the AtlasLoader, so each one is scaled once per zoom level.
+        """
+
+        if size is None:
+            return self.atlas_loader.get_frame(atlas_name, frame_name)
+        return self.atlas_loader.get_scaled_frame(atlas_name, frame_name, size, size)
 
     def _add_sprite_to_scene(self, sprite, row, col):
         
@@ -353,16 +491,16 @@ class MazeWidget(QWidget):
         item.setPos(col * self.cell_size, row * self.cell_size)
         self.scene.addItem(item)
 
-    def _get_floor_sprite(self, row, col):
+    def _get_floor_sprite(self, row, col, size=None):
         
         """
         This function returns the sprite for the floor at the specified row and column coordinate.
         The sprite is chosen depending on the position, alternating between "floor1" and "floor2".
         """
        
-        return self.atlas_loader.get_frame("maze", "floor1" if (row + col) % 2 == 0 else "floor2")
+        return self._get_sprite("maze", "floor1" if (row + col) % 2 == 0 else "floor2", size)
     
-    def _get_wall_sprite(self, row, col):
+    def _get_wall_sprite(self, row, col, size=None):
         
         """
     This function returns the sprite for the wall at the specified row and column coordinate.
@@ -371,39 +509,46 @@ class MazeWidget(QWidget):
     alternating between "wall1" and "wall2".
         """
 
-        return self.atlas_loader.get_frame("maze", "wall1" if (row + col) % 2 == 0 else "wall2")
+        return self._get_sprite("maze", "wall1" if (row + col) % 2 == 0 else "wall2", size)
 
     def _render_start_point(self):
         
         """
     This function renders the start point of the maze on the QGraphicsScene.
 
-    If a start point is set, this method gets the sprite for the start 
-    point from the atlas loader and adds it to the scene at the specified 
-    row and column coordinate of the start point.
+    The start point is a single item (self.start_item) on top of the maze layer. If it already
+    exists it is removed first, and if a start point is set, this method gets the sprite for the
+    start point from the atlas loader and adds it to the scene at the row and column of the start point.
 
         """
 
+        if self.start_item is not None:
+            self.scene.removeItem(self.start_item)
+            self.start_item = None
+        self.minimap.set_start(self.start_point)
+
         if self.start_point:
             row, col = self.start_point
             sprite = self.atlas_loader.get_frame("details", "stairs")
             if sprite and not sprite.isNull():
-                self._add_sprite_to_scene(sprite, row, col)
+                self.start_item = QGraphicsPixmapItem(sprite)
+                self.start_item.setPos(col * self.cell_size, row * self.cell_size)
+                self.scene.addItem(self.start_item)
             
     def _set_random_start_point(self):
         
         """
     This method sets a random start point in the maze.
 
-    This method randomly selects a valid position inside the maze bounds
-    and sets it as the start point. The selected cell is marked as the 
-    start point by updating its value in the maze matrix.
+    This method selects a path cell that can reach the goal with MazeGenerator.place_start,
+    which removes the previous start and marks the new one in the maze grid. By default the cell is
+    one random draw from the component of the goal in the open cell index, so it is never a wall
+    and the board is always solvable. The position comes from
+    the rng of the widget, seeded with the seed of the maze, so it can be repeated.
 
         """
 
-        import random
-        self.start_point = (random.randint(1, self.rows - 2), random.randint(1, self.cols - 2))
-        self.maze[self.start_point[0]][self.start_point[1]] = MazeGenerator.START
+        self.start_point = MazeGenerator.place_start(self.maze, self.rng)
 
     def _adjust_view(self):
         
@@ -411,60 +556,241 @@ class MazeWidget(QWidget):
         This method adjusts the view of the QGraphicsView to fit the maze inside the available
         space in the game area.
 
-        It calculates the scale factor to fit the maze in the available width and height, and
-        applies it to the view. The scale factor is multiplied by 0.95 to ensure there is a little
-        margin around the maze.
+        It calculates the scale factor to fit the maze in the available width and height.
+        The scale factor is multiplied by 0.95 to ensure there is a little
+        margin around the maze. It is also the smallest zoom of the view, and the mouse wheel zooms in
+        from there. The view rounds it down so a cell is a whole number of pixels (see MazeView.set_cell_size). When the cells are too small for their sprites, the maze layer draws its one pixel per cell
+        overview instead of the tiles (see MazeLayerItem), so even a 2001x2001 maze is shown whole at once.
 
         Then it sets the scene rectangle to the size of the maze and sets the size of the view
-        to the scaled size of the maze.
+        to the scaled size of the maze, without going over the available space.
+
+        If the cells of the whole maze would be smaller than FOLLOW_CELL_PIXELS, the minimap is shown in
+        the corner, and in Classic mode the view zooms in to that cell size around the player and follows
+        it while it moves (see _update_player_position).
 
         This method is called once the maze is rendered and the game area is resized.
         """
 
+        if self.maze is None:
+            return
+
         available_width = self.game_area.width()
         available_height = self.game_area.height()
         
-        self.scale_factor = min(
+        fit_scale = min(
             available_width / self.maze_width,
             available_height / self.maze_height
         ) * 0.95
-        
-        transform = QTransform()
-        transform.scale(self.scale_factor, self.scale_factor)
-        self.graphics_view.setTransform(transform)
-        
+        self.graphics_view.set_scale_limits(fit_scale)
+        self.scale_factor = self.graphics_view.min_scale  # Redondeado a píxeles enteros por celda
+        self.minimap_enabled = fit_scale * self.cell_size < self.FOLLOW_CELL_PIXELS
+        scale = self.scale_factor
+        if self.minimap_enabled and self.game_mode == 'Classic':
+            scale = self.FOLLOW_CELL_PIXELS / self.cell_size
+        self.graphics_view.set_scale(scale)
+        scale = self.graphics_view.scale_factor
+
         self.graphics_view.setSceneRect(QRectF(0, 0, self.maze_width, self.maze_height))
         self.graphics_view.setFixedSize(
-            int(self.maze_width * self.scale_factor), 
-            int(self.maze_height * self.scale_factor)
+            min(int(self.maze_width * scale), int(available_width * 0.95)),
+            min(int(self.maze_height * scale), int(available_height * 0.95))
         )
+        if self.player:
+            self._center_view_on(self.player['row'], self.player['col'])
+        elif self.start_point:
+            self._center_view_on(*self.start_point)
+
+        self.minimap.setVisible(self.minimap_enabled)
+        self.minimap.move(available_width - self.minimap.width() - self.MINIMAP_MARGIN, self.MINIMAP_MARGIN)
+        self.minimap.raise_()
+        self._update_minimap_view()
+
+    def _center_view_on(self, row, col):
+        
+        """
+        This method centers the view on the cell (row, col).
+        """
+
+        self.graphics_view.centerOn((col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size)
+
+    def _update_minimap_view(self):
+        
+        """
+        This method shows on the minimap the part of the maze visible in the view.
+        """
+
+        if self.minimap_enabled:
+            rect = self.graphics_view.visible_scene_rect()
+            self.minimap.set_view_rect(QRectF(rect.x() / self.cell_size, rect.y() / self.cell_size,
+                                              rect.width() / self.cell_size, rect.height() / self.cell_size))
 
     # ==================== SOLUTION METHODS ====================
     def _calculate_solutions(self):
         
         """
-        This method calculates all possible paths in the maze and stores them in the solutions attribute.
+        This method starts the search of the paths in the maze in a background MazeWorker.
 
-        It uses the MazeSolver class to find all paths in the maze, and then filters out duplicate paths
-        by sorting the coordinates of each path and using a set to keep track of seen paths. The solutions
-        are then sorted by length and number of steps, and the current solution index is reset to -1.
+        Any solve still running (for example for the previous start point) is cancelled first.
+        The shortest route is read from the DistanceField of the maze, a breadth-first search rooted at
+        the goal that is cached per maze and only rebuilt when the walls change. When the start point moves,
+        the cached field gives the new shortest route at once, so "View Solver" does not wait for the worker.
+        Otherwise the worker builds the field first. Then the worker enumerates the paths lazily with
+        MazeSolver.iter_solutions: the first pull is limited by FIRST_SOLUTIONS_LIMIT paths and
+        FIRST_SOLUTIONS_BUDGET seconds, and "Next Solver" pulls more solutions on demand (see _pull_solutions).
+        Mazes of the "large" size tier skip the enumeration and only keep the shortest route.
+        The results are received in _on_solutions_ready.
 
-        This method is called when the maze is generated or loaded, and when the game mode is changed.
+        If the start point and the goal are in different components of the open cell index, the maze has
+        no solution and nothing is searched. If there is no start point (it was removed), the status is cleared.
+
+        This method is called when the maze is generated or loaded, and when the start point changes.
         """
-        solver = MazeSolver(self.maze)
-        solver.solve()
+        self._cancel_solve()
+        maze, start = self.maze, self.start_point
+        self.solutions = []
+        self.seen_solutions = set()
+        self.current_solution_index = -1
+        if not MazeGenerator.open_cell_index(maze).connected(start, self._get_goal_point()):
+            self.solver = None
+            self.shortest_solution = None
+            # Sin punto de inicio no hay nada que resolver: no se muestra un recuento
+            self._set_status("0 solutions" if start is not None else "")
+            return
+
+        self.solver = MazeSolver(self.maze)
+        field = DistanceField.cached(maze)
+        self.shortest_solution = field.path_from(start) if field is not None else None
+        self.solving = True
+        self._set_status("Solving...")
+
+        solver = self.solver
+        enumerate_paths = GameConfig.get_size_tier(self.rows) != "large"
+        max_paths, time_budget = self.FIRST_SOLUTIONS_LIMIT, self.FIRST_SOLUTIONS_BUDGET
+
+        def solve_task(worker):
+            shortest = DistanceField.for_maze(maze).path_from(start)
+            batch = []
+            if enumerate_paths:
+                batch = list(solver.iter_solutions(max_paths, time_budget, worker.report_progress, worker.is_cancelled))
+            return solver, shortest, batch
+
+        self.solve_worker = MazeWorker(solve_task)
+        self.solve_worker.progress.connect(self._on_solve_progress)
+        self.solve_worker.result_ready.connect(self._on_solutions_ready)
+        self.solve_worker.failed.connect(self._on_worker_failed)
+        self.solve_worker.start()
+
+    def _on_solve_progress(self, found, steps):
         
-        unique_paths = []
-        seen_paths = set()
+        """
+        This method shows the progress of the background solve in the status label.
+        """
+
+        if self.solving:
+            self._set_status(f"Solving... {found} paths")
+
+    def _on_solutions_ready(self, result):
         
-        for path, length in solver.get_paths():
-            path_key = tuple(sorted((x, y) for x, y in path))
-            if path_key not in seen_paths:
-                seen_paths.add(path_key)
-                unique_paths.append((path, length))
+        """
+        This method receives the result of the background solve: the solver, the shortest route and
+        the first batch of paths. Results of a solve that was replaced by a newer one are ignored.
+        For "large" mazes, the shortest route is the only solution.
+        """
+
+        solver, shortest, batch = result
+        if solver is not self.solver:
+            return
+
+        self.solve_worker = None
+        self.solving = False
+        self.shortest_solution = shortest
+        if GameConfig.get_size_tier(self.rows) == "large":
+            # Demasiado grande para enumerar todas las rutas: solo la más corta
+            self.solutions = [(shortest, len(shortest))] if shortest else []
+            self.solver = None
+        else:
+            self._add_solutions(batch)
+        self._set_status(f"{len(self.solutions)} solutions" + ("" if self.solver is None or self.solver.search_complete else "+"))
+
+    def _cancel_solve(self):
         
-        self.solutions = sorted(unique_paths, key=lambda x: (x[1], len(x[0])))
-        self.current_solution_index = -1
+        """
+        This method cancels the background solve, if one is running.
+        """
+
+        if self.solve_worker is not None:
+            self.solve_worker.cancel()
+            self.solve_worker = None
+        self.solving = False
+
+    def cancel_background_work(self):
+        
+        """
+        This method cancels every background task of the widget (generation and solving).
+        It is called by the main window before the widget is destroyed.
+        """
+
+        self._cancel_solve()
+        if self.generation_worker is not None:
+            self.generation_worker.cancel()
+            self.generation_worker = None
+
+    def _on_worker_failed(self, message):
+        
+        """
+        This method shows the error of a background task that failed.
+        """
+
+        self.solving = False
+        self._set_status("")
+        QMessageBox.critical(self, "Error", f"Background task failed: {message}")
+
+    def _set_status(self, text):
+        
+        """
+        This method sets the text of the status label of the bottom panel.
+        """
+
+        self.status_label.setText(text)
+
+    def _pull_solutions(self, max_paths, time_budget):
+        
+        """
+        This method pulls the next solutions from the solver, at most max_paths of them and for at most
+        time_budget seconds, and adds them to the solutions attribute.
+
+        Returns True if new solutions were added.
+        """
+
+        if self.solver is None or self.solving or self.solver.search_complete:
+            return False
+
+        batch = list(self.solver.iter_solutions(max_paths=max_paths, time_budget=time_budget))
+        return self._add_solutions(batch)
+
+    def _add_solutions(self, batch):
+        
+        """
+        This method adds a batch of paths found by the solver to the solutions attribute.
+
+        Duplicate paths (same set of cells) are filtered out with the seen_solutions set. Each
+        batch is sorted by length and added after the solutions already shown, so the list is in length
+        order when the whole search fits in the first pull, and best-so-far order otherwise.
+
+        Returns True if new solutions were added.
+        """
+
+        unique = []
+        for path, length in batch:
+            path_key = frozenset(path)
+            if path_key not in self.seen_solutions:
+                self.seen_solutions.add(path_key)
+                unique.append((path, length))
+
+        unique.sort(key=lambda x: x[1])
+        self.solutions.extend(unique)
+        return bool(unique)
 
     def show_shortest_solution(self):
         
@@ -474,102 +800,209 @@ class MazeWidget(QWidget):
     If no solutions are available, it informs the user via a message box.
     In 'Classic' game mode, it initiates a backtracking animation.
     In other modes, it clears the current solution, resets the solution index,
-    and displays the shortest solution path. Marks the maze as solved.
+    and displays the shortest solution path, which comes from the shortest-path search
+    and not from the list of enumerated solutions. Marks the maze as solved.
+    While the background solve is running, it only asks the user to wait, unless the
+    shortest route is already known from the cached distance field (Solver mode).
         """
 
-        if not self.solutions:
+        if self.solving and (self.game_mode == 'Classic' or self.shortest_solution is None):
+            QMessageBox.information(self, "Solving", "The solver is still working, please wait.")
+            return
+
+        if not self.solutions and not self.shortest_solution:
             QMessageBox.information(self, "No Solutions", "No solutions found for this maze.")
             return
 
         if self.game_mode == 'Classic':
-            self.showing_backtracking_animation = True
+            if self.showing_backtracking_animation:
+                return
             self.show_backtracking_animation(self.maze)
             self.solved = True
 
         else:
             self._clear_solution()
             self.current_solution_index = 0
-            self._display_solution(self.solutions[self.current_solution_index][0])
+            self._display_solution(self.shortest_solution or self.solutions[0][0])
             self.solved = True
 
 
     def show_backtracking_animation(self, maze):
         
         """
-        This method displays a backtracking animation of the maze solving process.
+        This method starts a backtracking animation of the maze solving process.
+
+        It clears the current solution and takes the search, step by step, from
+        MazeSolver.iter_backtracking_steps, which explores the maze from the start point
+        following the directions up, left, down and right. For each cell explored, the cell is
+        marked with an asterisk (*) in blue, and when the search backtracks out of a cell it is
+        marked with a dash (-) in white.
 
-        It clears the current solution, makes a copy of the maze, and starts a backtracking
-        search from the start point of the maze. The search is done recursively following
-        the directions given in the 'directions' variable (up, left, down, right). The
-        visited matrix is used to keep track of visited cells. For each cell visited, it
-        marks it with an asterisk (*) and waits for 100ms before continuing with the
-        search. When it reaches a dead end, it backtracks by popping the last element from
-        the path and marking the cell with a dash (-). The animation is stopped when the
-        backtracking search is finished.
+        The steps are not taken in a loop that sleeps: a QTimer takes animation_steps_per_tick steps
+        every animation_interval milliseconds (see _advance_backtracking_animation), so the window keeps
+        handling events while the animation runs. The animation can be paused, resumed, sped up,
+        slowed down, cancelled or skipped to the end from the keyboard (see _handle_animation_key).
 
         This method is called when the user clicks the "View Solver" button in the
         'Classic' game mode.
         """
 
         self._clear_solution()
-        showmaze = [row[:] for row in maze]  # Copia del laberinto
+        self.animation_solver = MazeSolver(maze)
+        self.backtracking_steps = self.animation_solver.iter_backtracking_steps()
+        self.showing_backtracking_animation = True
+        self.animation_paused = False
+        self.backtracking_timer.start(self.animation_interval)
+        self._show_animation_status()
+        self.setFocus()
 
-        path_steps = []
-        directions = [(-1, 0), (0, -1), (1, 0), (0, 1)] 
+    def _advance_backtracking_animation(self):
         
-        visited = []
-        for _ in range(self.rows):
-            row = []
-            for _ in range(self.cols):
-                row.append(False)
-            visited.append(row)
+        """
+        This method is called by the backtracking timer. It takes the next animation_steps_per_tick
+        steps of the search and draws them. When the search has no more steps, the animation ends.
+        """
 
-        def backtrack(x, y, path):
+        for _ in range(self.animation_steps_per_tick):
+            step = next(self.backtracking_steps, None)
+            if step is None:
+                self._finish_backtracking_animation()
+                return
+            row, col, status = step
+            self.update_ui(row, col, status)
 
-            
-            """
-            This is a recursive function that performs a backtracking search from the given cell (x, y) to the goal point.
+    def _finish_backtracking_animation(self):
+        
+        """
+        This method stops the backtracking timer and marks the animation as finished.
+        """
 
-            The search is done following the directions given in the 'directions' variable (up, left, down, right). The
-            visited matrix is used to keep track of visited cells. For each cell visited, it marks it with an asterisk (*) and
-            waits for 100ms before continuing with the search. When it reaches a dead end, it backtracks by deleting the last
-            element from the path and marking the cell with a dash (-). The animation is stopped when the backtracking search
-            is finished.
+        self.backtracking_timer.stop()
+        self.backtracking_steps = None
+        self.animation_solver = None
+        self.showing_backtracking_animation = False
+        self.animation_paused = False
+        self._set_status("")
 
-            This function is called from the show_backtracking_animation method and is used to display a backtracking animation
-            of the maze solving process.
+    def pause_animation(self):
+        
+        """
+        This method pauses the backtracking animation, keeping its state.
+        """
 
-            """
+        if self.showing_backtracking_animation and not self.animation_paused:
+            self.animation_paused = True
+            self.backtracking_timer.stop()
+            self._show_animation_status()
 
-            if (x, y) == self._get_goal_point():
-                return
+    def resume_animation(self):
+        
+        """
+        This method resumes a paused backtracking animation from where it stopped.
+        """
+
+        if self.showing_backtracking_animation and self.animation_paused:
+            self.animation_paused = False
+            self.backtracking_timer.start(self.animation_interval)
+            self._show_animation_status()
+
+    def cancel_animation(self):
+        
+        """
+        This method stops the backtracking animation and clears the cells it has marked.
+        """
+
+        if self.showing_backtracking_animation:
+            self._finish_backtracking_animation()
+            self._clear_solution()
+
+    def skip_animation(self):
+        
+        """
+        This method jumps to the end of the backtracking animation. Instead of running the remaining
+        steps, the final state (every explored cell marked with "-") is drawn directly with
+        MazeSolver.backtracking_final_cells.
+        """
 
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.rows and 0 <= ny < self.cols:
-                    if showmaze[nx][ny] in [1, 2, 3, 4] and not visited[nx][ny]:
-                        visited[nx][ny] = True
-                        path.append((nx, ny))
+        if not self.showing_backtracking_animation:
+            return
+        final_cells = self.animation_solver.backtracking_final_cells()
+        self._finish_backtracking_animation()
+        self._clear_solution()
+        for row, col in final_cells:
+            self.update_ui(row, col, "-")
 
-                        # Marcar exploración
-                        self.update_ui(nx, ny, "*")
-                        QCoreApplication.processEvents()
-                        QThread.msleep(100)  # Velocidad de la animación
+    def set_animation_speed(self, interval=None, steps_per_tick=None):
+        
+        """
+        This method changes the speed of the backtracking animation: interval is the time in
+        milliseconds between frames, and steps_per_tick is how many steps of the search are drawn
+        in each frame. Both are kept within the MIN/MAX limits of the widget.
+        """
 
-                        backtrack(nx, ny, path)
+        if interval is not None:
+            self.animation_interval = max(self.MIN_ANIMATION_INTERVAL, min(self.MAX_ANIMATION_INTERVAL, interval))
+            if self.backtracking_timer.isActive():
+                self.backtracking_timer.setInterval(self.animation_interval)
+        if steps_per_tick is not None:
+            self.animation_steps_per_tick = max(1, min(self.MAX_ANIMATION_STEPS, steps_per_tick))
+        self._show_animation_status()
 
-                        # Retroceso
-                        path.pop()
-                        visited[nx][ny] = False
+    def _change_animation_speed(self, faster):
+        
+        """
+        This method makes the animation twice as fast or twice as slow. The interval between frames
+        is changed first; once it reaches its minimum, more steps are drawn in each frame.
+        """
 
-                        self.update_ui(nx, ny, "-")
-                        QCoreApplication.processEvents()
-                        QThread.msleep(100)
+        if faster:
+            if self.animation_interval > self.MIN_ANIMATION_INTERVAL:
+                self.set_animation_speed(interval=self.animation_interval // 2)
+            else:
+                self.set_animation_speed(steps_per_tick=self.animation_steps_per_tick * 2)
+        else:
+            if self.animation_steps_per_tick > 1:
+                self.set_animation_speed(steps_per_tick=self.animation_steps_per_tick // 2)
+            else:
+                self.set_animation_speed(interval=self.animation_interval * 2)
 
-        sx, sy = self.start_point
-        visited[sx][sy] = True
-        backtrack(sx, sy, [(sx, sy)])
-        self.showing_backtracking_animation = False
+    def _handle_animation_key(self, key):
+        
+        """
+        This method handles the keys that control the backtracking animation:
+
+        * Space: pause / resume
+        * + : faster
+        * - : slower
+        * Enter: skip to the end
+        * Escape: cancel
+        """
+
+        if key == Qt.Key.Key_Space:
+            if self.animation_paused:
+                self.resume_animation()
+            else:
+                self.pause_animation()
+        elif key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self._change_animation_speed(faster=True)
+        elif key in (Qt.Key.Key_Minus, Qt.Key.Key_Underscore):
+            self._change_animation_speed(faster=False)
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.skip_animation()
+        elif key == Qt.Key.Key_Escape:
+            self.cancel_animation()
+
+    def _show_animation_status(self):
+        
+        """
+        This method shows the state and speed of the backtracking animation in the status label.
+        """
+
+        if not self.showing_backtracking_animation:
+            return
+        state = "Paused" if self.animation_paused else "Animating"
+        steps_per_second = self.animation_steps_per_tick * 1000 // self.animation_interval
+        self._set_status(f"{state}: {steps_per_second} steps/s")
 
     def update_ui(self, x, y, status):
         
@@ -583,7 +1016,7 @@ class MazeWidget(QWidget):
         - 3: Start
         - 4: Goal
 
-        This method creates a QGraphicsOpacityEffect to set the opacity of the cell, and adds it to the scene.
+        This method colors the cell in the solution overlay, which repaints only that cell; no new item is added to the scene.
         If the status is "*" or "-", it sets the opacity to 0.6 to show the progression of the backtracking algorithm.
         """
         
@@ -598,21 +1031,9 @@ class MazeWidget(QWidget):
         else:  # Muros o caminos normales
             color = Qt.GlobalColor.white
 
-        # Crear el elemento visual de la celda
-        cell_pixmap = QPixmap(self.cell_size, self.cell_size)
-        cell_pixmap.fill(color)
-
-        item = QGraphicsPixmapItem(cell_pixmap)
-        opacity_effect = QGraphicsOpacityEffect()
-        opacity_effect.setOpacity(0.6 if status in ("*", "-") else 1.0)  # Opacidad para progresión
-        item.setGraphicsEffect(opacity_effect)
-
-        #    Ajustar posición en el gráfico
-        item.setPos(y * self.cell_size, x * self.cell_size)
-        self.scene.addItem(item)
-
-        # Añadir el item a una lista si necesitas limpiar después
-        self.solution_items.append(item)
+        # Opacidad para progresión
+        self.solution_overlay.set_cell(x, y, color, 0.6 if status in ("*", "-") else 1.0)
+        self.is_showing_solution = True
 
     def show_next_solution(self):
         
@@ -620,14 +1041,20 @@ class MazeWidget(QWidget):
     This method displays the next solution path in the maze.
 
     This method cycles through the list of available solutions and displays
-    the next solution in sequence. If there are no solutions available,
+    the next solution in sequence. When the end of the list is reached and the
+    solver has not finished the search, more solutions are pulled on demand
+    before going back to the first one. If there are no solutions available,
     it informs the user via a message box. The method does nothing if a 
     backtracking animation is currently being shown. The current solution 
     is cleared before displaying the next one. The maze is marked as solved 
-    once a solution is displayed.
+    once a solution is displayed. While the background solve is running, it only asks the user to wait.
 
         """
 
+        if self.solving:
+            QMessageBox.information(self, "Solving", "The solver is still working, please wait.")
+            return
+
         if not self.solutions:
             QMessageBox.information(self, "No Solutions", "No solutions found for this maze.")
             return
@@ -637,7 +1064,10 @@ class MazeWidget(QWidget):
 
         self._clear_solution()
         self.solved = True
-        self.current_solution_index = (self.current_solution_index + 1) % len(self.solutions)
+        next_index = self.current_solution_index + 1
+        if next_index >= len(self.solutions):
+            self._pull_solutions(self.NEXT_SOLUTIONS_LIMIT, self.NEXT_SOLUTIONS_BUDGET)
+        self.current_solution_index = next_index % len(self.solutions)
         self._display_solution(self.solutions[self.current_solution_index][0])
         self.scene.update()
 
@@ -649,12 +1079,11 @@ class MazeWidget(QWidget):
     This function displays a visual representation of a given solution path in the maze.
 
     This method takes a path, represented as a list of (row, col) tuples, and 
-    renders it on the scene using colored pixmaps. The path must have more 
+    renders it in the solution overlay, with a single repaint. The path must have more 
     than two points to be displayed. The color of the path varies based on 
     the current solution index: green for the optimal solution, red for the 
-    worst solution, and dark blue for average solutions. Each cell in the 
-    path is rendered with a semi-transparent pixmap. The method updates the 
-    solution_items list with the rendered items and marks the solution as 
+    worst solution (only known once the search is complete), and dark blue for average solutions. Each cell in the 
+    path is rendered semi-transparent. The method marks the solution as 
     currently being shown.
     
         """
@@ -665,38 +1094,65 @@ class MazeWidget(QWidget):
         colors = [Qt.GlobalColor.green, Qt.GlobalColor.red, Qt.GlobalColor.darkBlue]
         if self.current_solution_index == 0:
             color = colors[0]
-        elif self.current_solution_index == len(self.solutions) - 1:
+        elif self.current_solution_index == len(self.solutions) - 1 and (self.solver is None or self.solver.search_complete):
             color = colors[1]
         else:
             color = colors[2]
 
-        for row, col in path[1:-1]:
-            solution_pixmap = QPixmap(self.cell_size, self.cell_size)
-            solution_pixmap.fill(color)
-            
-            item = QGraphicsPixmapItem(solution_pixmap)
-            opacity_effect = QGraphicsOpacityEffect()
-            opacity_effect.setOpacity(0.4)
-            item.setGraphicsEffect(opacity_effect)
-            item.setPos(col * self.cell_size, row * self.cell_size)
-            self.scene.addItem(item)
-            self.solution_items.append(item)
+        self.solution_overlay.set_cells(path[1:-1], color, 0.4)
+        self.minimap.set_solution(path, color)
         self.is_showing_solution = True
 
+    def show_hint(self):
+        
+        """
+    This method highlights the next HINT_LENGTH cells of the shortest route from the player to the goal.
+
+    The route is read from the cached DistanceField of the maze (built by the background solve), so a hint
+    costs only the steps it shows: there is no new search and no animation, and the player can keep moving.
+    The hint is cleared when the player moves. It only works in Classic mode while the game is being played.
+        """
+
+        if self.game_mode != 'Classic' or not self.player or self.goal_reached or self.solved or self.showing_backtracking_animation:
+            return
+
+        field = DistanceField.cached(self.maze)
+        if field is None:
+            if self.solving:
+                QMessageBox.information(self, "Solving", "The solver is still working, please wait.")
+                return
+            field = DistanceField.for_maze(self.maze)
+
+        path = field.path_from((self.player['row'], self.player['col']), self.HINT_LENGTH)
+        if path is None:
+            QMessageBox.information(self, "No Solutions", "The goal cannot be reached from here.")
+            return
+
+        self._clear_solution()
+        self.hint_cells = path[1:]
+        self.solution_overlay.set_cells(self.hint_cells, self.HINT_COLOR, 0.5)
+        self.showing_hint = True
+
     def _clear_solution(self):
         
         """
         This function clears the current solution path from the scene.
 
-        This method removes all items in the solution_items list from the scene and
-        clears the list. It also sets is_showing_solution to False, indicating that
+        This method clears the solution overlay (paths and backtracking trace) with a single repaint.
+        It also sets is_showing_solution to False, indicating that
         there is currently no solution being displayed.
+        When only a hint is shown, only its cells are cleared, so hints cost the same on any board size.
         """
         
-        for item in self.solution_items:
-            self.scene.removeItem(item)
-        self.solution_items.clear()
+        if self.solution_overlay is not None:
+            if self.showing_hint and not self.is_showing_solution:
+                self.solution_overlay.clear_cells(self.hint_cells)
+            else:
+                self.solution_overlay.clear()
+        self.hint_cells = []
+        self.minimap.set_solution(None)
         self.is_showing_solution = False
+        self.showing_hint = False
     
     # ==================== SAVE MAP LOGIC ==================== #
 
@@ -708,8 +1164,8 @@ class MazeWidget(QWidget):
         If no file path is provided, it saves the maze in the "savegames" folder
         with a default name in the format "Map_<game_mode>_<timestamp>.json".
 
-        The saved data includes the maze matrix, game mode, start point, goal point, and
-        the number of rows and columns in the maze.
+        The saved data includes the maze matrix, game mode, start point, goal point,
+        the number of rows and columns in the maze, and the seed and algorithm used to generate it.
 
         If the start point is not set, or if a backtracking animation is being shown,
         or if the maze has not been generated, this method does nothing and shows an
@@ -737,12 +1193,14 @@ class MazeWidget(QWidget):
 
         # Preparar los datos para guardar
         data_to_save = {
-            "map": self.maze,  # La matriz del laberinto
+            "map": self.maze.to_list(),  # La matriz del laberinto
             "game_mode": self.game_mode,
             "start_point": self.start_point,
             "goal_point": self._get_goal_point(),  # Buscar posición del GOAL
             "rows": self.rows,
-            "cols": self.cols
+            "cols": self.cols,
+            "seed": self.maze.seed,
+            "algorithm": self.maze.algorithm
         }
 
 
@@ -757,13 +1215,9 @@ class MazeWidget(QWidget):
     def _get_goal_point(self):
         """
         This function searches for the position of the goal point in the maze. Since there is not any variable to store the goal point,
-        it iterates through the maze matrix to find the position of the GOAL character.
+        it searches the maze grid to find the position of the GOAL value.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.maze[r][c] == MazeGenerator.GOAL:
-                    return (r, c)
-        return None
+        return self.maze.find(MazeGenerator.GOAL)
     
         
     
@@ -828,6 +1282,8 @@ class MazeWidget(QWidget):
         actual position in pixels. It then sets the player item's position using the setPos method.
         The y-coordinate is adjusted by subtracting the pixmap's height minus the cell size to align
         the bottom of the pixmap with the bottom of the cell.
+        The player dot of the minimap moves with it, and when the minimap is shown the view scrolls
+        to keep the player away from its borders.
         """
 
         player_pixmap = self.player_item.pixmap()
@@ -836,6 +1292,10 @@ class MazeWidget(QWidget):
                 self.player['col'] * self.cell_size,
                 self.player['row'] * self.cell_size - (player_pixmap.height() - self.cell_size)
             )
+        self.minimap.set_player((self.player['row'], self.player['col']))
+        if self.minimap_enabled:
+            viewport = self.graphics_view.viewport()
+            self.graphics_view.ensureVisible(self.player_item, viewport.width() // 4, viewport.height() // 4)
 
     def _update_animation_frame(self):
         
@@ -901,12 +1361,19 @@ class MazeWidget(QWidget):
         It then checks if the animation should be stopped. If so, it stops the stop animation timer and sets the
         should_stop_animating flag to False.
 
-        It then gets the key that was pressed and checks if it is a valid direction. If it is, it updates the player's
-        direction and position accordingly.
+        It then gets the key that was pressed. H shows a hint (see show_hint). Otherwise it checks if it is a valid
+        direction. If it is, it updates the player's direction and position accordingly.
 
         Finally, it calls the _handle_player_movement method to handle the player's movement.
 
+        While the backtracking animation is running, the keys control the animation instead
+        (see _handle_animation_key).
+
         """
+
+        if self.showing_backtracking_animation:
+            self._handle_animation_key(event.key())
+            return
         
         if self.game_mode != 'Classic' or not self.player or self.goal_reached or self.solved or self.showing_backtracking_animation:
             return
@@ -916,6 +1383,10 @@ class MazeWidget(QWidget):
             self.stop_animation_timer.stop()
             
         key = event.key()
+        if key == Qt.Key.Key_H:
+            self.show_hint()
+            return
+
         new_row, new_col = self.player['row'], self.player['col']
         direction_changed = False
         
@@ -953,7 +1424,7 @@ class MazeWidget(QWidget):
 
         It then checks if the cell at the new position is a valid path, shortcut, goal or start. If not, it returns without doing anything.
 
-        It then updates the player's row and column coordinates to the new position.
+        It then updates the player's row and column coordinates to the new position, and clears the hint if one is shown.
 
         If the player has reached the goal, it sets the goal_reached flag to True and shows a message box to the user.
 
@@ -968,12 +1439,14 @@ class MazeWidget(QWidget):
         if not (0 <= new_row < self.rows and 0 <= new_col < self.cols):
             return
             
-        cell_value = self.maze[new_row][new_col]
+        cell_value = self.maze.get(new_row, new_col)
         if cell_value not in [MazeGenerator.PATH, MazeGenerator.SHORTCUT, 
                             MazeGenerator.GOAL, MazeGenerator.START]:
             return
             
         self.player['row'], self.player['col'] = new_row, new_col
+        if self.showing_hint:
+            self._clear_solution()
         
         if cell_value == MazeGenerator.GOAL:
             self.goal_reached = True
@@ -1030,7 +1503,7 @@ class MazeWidget(QWidget):
         Finally, it calculates the solutions for the new start point.
         """
 
-        if GameConfig.get_game_mode() != "Solver" or not self.selecting_start_point:
+        if GameConfig.get_game_mode() != "Solver" or not self.selecting_start_point or self.maze is None:
             return
 
         view_pos = self.graphics_view.mapFromParent(event.position().toPoint())
@@ -1046,19 +1519,20 @@ class MazeWidget(QWidget):
             QMessageBox.warning(self, "Out of Bounds", "Clicked outside the maze bounds.")
             return
             
-        if self.maze[row][col] != MazeGenerator.PATH:
+        if self.maze.get(row, col) != MazeGenerator.PATH:
             QMessageBox.warning(self, "Invalid Cell", "Cannot place start on a wall or shortcut.")
             return
             
         if self.start_point is not None:
             old_row, old_col = self.start_point
-            self.maze[old_row][old_col] = MazeGenerator.PATH
+            self.maze.set(old_row, old_col, MazeGenerator.PATH)
             self._render_cell(old_row, old_col)
             
         self._clear_solution()
         self.start_point = (row, col)
-        self.maze[row][col] = MazeGenerator.START
+        self.maze.set(row, col, MazeGenerator.START)
         self._render_cell(row, col)
+        self._render_start_point()
         self.selecting_start_point = False
         self._calculate_solutions()
 
@@ -1092,9 +1566,10 @@ class MazeWidget(QWidget):
             QMessageBox.information(self, "Oops!", "You haven't placed a start point yet!")
         else:
             row, col = self.start_point
-            self.maze[row][col] = MazeGenerator.PATH
+            self.maze.set(row, col, MazeGenerator.PATH)
             self._render_cell(row, col)
             self.start_point = None
+            self._render_start_point()
             self.selecting_start_point = True
             self._clear_solution()
             self._calculate_solutions()
@@ -1107,17 +1582,14 @@ class MazeWidget(QWidget):
         window size while maintaining its aspect. If the image is not found or
         an error occurs during loading, a solid dark gray color is used instead.
         The background is then sent to the back of the window.
+        The scaled image comes from the BackgroundCache, which is warmed at startup, so
+        starting a game does not decode the image again.
         """
 
         self.background = QLabel(self)
         try:
-            pixmap = QPixmap("assets/bg_maze.png")
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(
-                    1000, 800,
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+            pixmap = BackgroundCache.get("bg_maze.png")
+            if pixmap is not None:
                 self.background.setPixmap(pixmap)
                 self.background.setGeometry(0, 0, 1000, 800)
                 self.background.lower()
@@ -1133,8 +1605,8 @@ class MazeWidget(QWidget):
         
         """
     This method is connected to navigate back from the current maze widget to a
-    previous screen. If a backtracking animation is running, it exits without
-    performing any action. Otherwise, it resets the game configuration and
+    previous screen. If a backtracking animation is running, it is cancelled first.
+    Then, it resets the game configuration and
     attempts to call a cleanup handler in the parent window if it exists.
     It then sets the view to a specific index in the parent window. In case of
     an error during this process, it defaults to setting the view to the main
@@ -1142,8 +1614,7 @@ class MazeWidget(QWidget):
     
         """
 
-        if self.showing_backtracking_animation == True:
-            return
+        self.cancel_animation()
         
         if self.parent_window:
             try:
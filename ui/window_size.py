@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QPixmap, QPalette
 from config.game_config import GameConfig
+from config.background_cache import BackgroundCache
 
 class SizeSelectWidget(QWidget):
     start_game_signal = pyqtSignal()
@@ -103,14 +104,9 @@ class SizeSelectWidget(QWidget):
 
         self.background = QLabel(self)
         try:
-            pixmap = QPixmap("assets/bg_game_mode.png")
-            if pixmap.isNull():
+            pixmap = BackgroundCache.get("bg_game_mode.png")
+            if pixmap is None:
                 raise FileNotFoundError
-            pixmap = pixmap.scaled(
-                1000, 800, 
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
             self.background.setPixmap(pixmap)
             self.background.setGeometry(0, 0, 1000, 800)
             self.background.lower()